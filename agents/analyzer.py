@@ -1,9 +1,8 @@
 from utils.llm import llm
 
-def analyze_dataset(dataset_info: dict, strategy_context: str = ""):
-    """Analyze dataset for anomalies, missing values, duplicates, outliers, etc."""
-    
-    prompt = f"""
+# Static instructions stay byte-identical across runs so provider-side prompt
+# caching can reuse the prefix; everything dataset-specific goes in the tail.
+_SYSTEM_PREFIX = """
 You are a data quality analyst. Analyze the dataset information and identify all data quality issues.
 
 Focus on:
@@ -17,25 +16,37 @@ Focus on:
 
 If STRATEGY CONTEXT is provided, reference similar issues found in past analyses.
 
+Provide a detailed analysis of all data quality issues found.
+"""
+
+def _build_prompt(dataset_info: dict, strategy_context: str) -> str:
+    return f"""
 STRATEGY CONTEXT:
 {strategy_context}
 
 DATASET INFORMATION:
-File: {dataset_info['file_name']}
-Rows: {dataset_info['rows']}
-Columns: {dataset_info['columns']}
-Column Names: {dataset_info['column_names']}
-Data Types: {dataset_info['dtypes']}
-Missing Values: {dataset_info['missing_values']}
-Duplicate Rows: {dataset_info['duplicates']}
-Memory Usage: {dataset_info['memory_usage']}
-
-Sample Data (first 5 rows):
-{dataset_info['head']}
-
-Basic Statistics:
-{dataset_info['statistics']}
-
-Provide a detailed analysis of all data quality issues found.
+{dataset_info['prompt_context']}
 """
-    return llm.invoke(prompt)
+
+async def analyze_dataset(dataset_info: dict, strategy_context: str = "", column_groups: list = None, on_chunk=None):
+    """Analyze dataset for anomalies, missing values, duplicates, outliers, etc.
+    
+    Wide datasets can pass ``column_groups`` (see ``get_column_group_infos``);
+    the groups are analyzed as one batch sharing the static prefix and the
+    per-group findings are concatenated.  ``on_chunk`` receives output text
+    as it is generated (batched groups report once, when all are done).
+    """
+    
+    if not column_groups:
+        prompt = _build_prompt(dataset_info, strategy_context)
+        return await llm.ainvoke(prompt, system=_SYSTEM_PREFIX, agent="analyzer", on_chunk=on_chunk)
+    
+    prompts = [_build_prompt(group, strategy_context) for group in column_groups]
+    analyses = await llm.abatch(prompts, system=_SYSTEM_PREFIX, agent="analyzer")
+    analysis = "\n\n".join(
+        f"### Analysis for {group['column_group']}\n\n{text.strip()}"
+        for group, text in zip(column_groups, analyses)
+    )
+    if on_chunk is not None:
+        on_chunk(analysis)
+    return analysis
@@ -1,14 +1,10 @@
 from utils.llm import llm
 
-def evaluate_data_quality(dataset_info: dict, analysis: str, recommendations: str, strategy_context: str = ""):
-    """Evaluate the overall data quality and the proposed cleaning strategies."""
-    
-    prompt = f"""
+# Static instructions stay byte-identical across runs so provider-side prompt
+# caching can reuse the prefix; everything dataset-specific goes in the tail.
+_SYSTEM_PREFIX = """
 You are a data quality assessor. Evaluate the dataset's overall quality and the proposed cleaning strategies.
 
-STRATEGY CONTEXT (for comparison with past evaluations):
-{strategy_context}
-
 Provide:
 1. Overall Data Quality Score (0-100)
    - Completeness score (0-100)
@@ -35,6 +31,21 @@ Provide:
    - Recommended order of operations
    - Additional analysis needed
 
+Use the STRATEGY CONTEXT, when provided, for comparison with past evaluations.
+
+Provide a comprehensive quality assessment.
+"""
+
+async def evaluate_data_quality(dataset_info: dict, analysis: str, recommendations: str, strategy_context: str = "", on_chunk=None):
+    """Evaluate the overall data quality and the proposed cleaning strategies.
+    
+    ``on_chunk`` receives output text as it is generated.
+    """
+    
+    prompt = f"""
+STRATEGY CONTEXT (for comparison with past evaluations):
+{strategy_context}
+
 DATASET INFO:
 File: {dataset_info['file_name']}
 Rows: {dataset_info['rows']}
@@ -47,7 +58,5 @@ ANALYSIS:
 
 RECOMMENDATIONS:
 {recommendations}
-
-Provide a comprehensive quality assessment.
 """
-    return llm.invoke(prompt)
+    return await llm.ainvoke(prompt, system=_SYSTEM_PREFIX, agent="evaluator", on_chunk=on_chunk)
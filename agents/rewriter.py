@@ -1,15 +1,11 @@
 from utils.llm import llm
 from utils.postprocess import strip_model_preamble
 
-def recommend_cleaning_strategies(dataset_info: dict, analysis: str, strategy_context: str = ""):
-    """Generate specific, actionable data cleaning recommendations."""
-    
-    prompt = f"""
+# Static instructions stay byte-identical across runs so provider-side prompt
+# caching can reuse the prefix; everything dataset-specific goes in the tail.
+_SYSTEM_PREFIX = """
 You are a data cleaning expert. Based on the dataset analysis, provide specific, actionable cleaning strategies.
 
-STRATEGY CONTEXT (reference similar past strategies):
-{strategy_context}
-
 For each identified issue, provide:
 1. Priority level (Critical/High/Medium/Low)
 2. Specific cleaning method (imputation, removal, transformation, etc.)
@@ -30,6 +26,22 @@ Formatting requirements:
 - Be specific and actionable.
 - Include code examples where helpful.
 
+Reference similar past strategies from the STRATEGY CONTEXT when it is provided.
+
+Provide comprehensive cleaning strategies.
+"""
+
+async def recommend_cleaning_strategies(dataset_info: dict, analysis: str, strategy_context: str = "", on_chunk=None):
+    """Generate specific, actionable data cleaning recommendations.
+    
+    ``on_chunk`` receives the raw output as it is generated; the returned
+    text has any model preamble stripped.
+    """
+    
+    prompt = f"""
+STRATEGY CONTEXT (reference similar past strategies):
+{strategy_context}
+
 DATASET INFO:
 File: {dataset_info['file_name']}
 Rows: {dataset_info['rows']}
@@ -37,7 +49,5 @@ Columns: {dataset_info['columns']}
 
 ANALYSIS RESULTS:
 {analysis}
-
-Provide comprehensive cleaning strategies.
 """
-    return strip_model_preamble(llm.invoke(prompt))
+    return strip_model_preamble(await llm.ainvoke(prompt, system=_SYSTEM_PREFIX, agent="rewriter", on_chunk=on_chunk))
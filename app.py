@@ -15,7 +15,7 @@ import streamlit as st
 
 from components.styles import inject_custom_css
 from components.ui_helpers import status_badge, divider
-from components.sidebar import render_sidebar
+from components.sidebar import render_sidebar, load_frame
 from components.dataset_preview import render_dataset_preview
 from components.results_display import render_results
 
@@ -36,7 +36,7 @@ inject_custom_css()
 # ---------------------------------------------------------------------------
 _DEFAULTS: Dict[str, object] = {
     "uploaded_file": None,
-    "df": None,
+    "df_path": None,           # Arrow/Feather copy of the upload (see load_frame)
     "file_path": None,
     "result": None,
     "status": "idle",          # idle | running | done | error
@@ -70,30 +70,55 @@ divider()
 # ---------------------------------------------------------------------------
 # No file uploaded yet — show landing state
 # ---------------------------------------------------------------------------
-if st.session_state.df is None:
+if st.session_state.df_path is None:
     if st.session_state.status == "error":
         st.error(f"**Failed to read file:** {st.session_state.error_msg}")
     else:
         st.info("Upload a dataset from the sidebar to get started.", icon=":material/folder_open:")
     st.stop()
 
+df = load_frame(st.session_state.df_path)
+
 # ---------------------------------------------------------------------------
 # Dataset preview (extracted to component)
 # ---------------------------------------------------------------------------
-render_dataset_preview(st.session_state.df)
+render_dataset_preview(df, st.session_state.df_path, fast=st.session_state.get("fast_preview", True))
 
 # ---------------------------------------------------------------------------
 # Run analysis button
 # ---------------------------------------------------------------------------
+_LIVE_TITLES = {
+    "analysis": "Anomaly Analysis",
+    "recommendations": "Cleaning Recommendations",
+    "evaluation": "Quality Assessment",
+}
+
+
 def _run_pipeline():
-    """Execute the cleaning pipeline and store results in session state."""
+    """Execute the cleaning pipeline and store results in session state.
+
+    Agent output is painted into live panels as it streams in; the rerun
+    that follows replaces them with the full results view.
+    """
     from core.controller import clean_dataset
 
+    live = st.container()
+    panels: Dict[str, object] = {}
+    streamed: Dict[str, str] = {}
+
+    def _on_chunk(section: str, chunk: str) -> None:
+        if section not in panels:
+            with live:
+                st.markdown(f"##### {_LIVE_TITLES.get(section, section)}")
+                panels[section] = st.empty()
+        streamed[section] = streamed.get(section, "") + chunk
+        panels[section].markdown(streamed[section])
+
     st.session_state.status = "running"
     st.session_state.error_msg = ""
     try:
         start = time.time()
-        result = clean_dataset(st.session_state.file_path)
+        result = clean_dataset(st.session_state.file_path, on_chunk=_on_chunk)
         st.session_state.elapsed = time.time() - start
         st.session_state.result = result
         st.session_state.status = "done"
@@ -135,6 +160,7 @@ if st.session_state.result is None:
 render_results(
     st.session_state.result,
     uploaded_file_name=st.session_state.uploaded_file.name,
-    df=st.session_state.df,
+    df=df,
+    frame_key=st.session_state.df_path,
     show_rag_debug=show_rag_debug,
 )
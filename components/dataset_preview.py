@@ -5,62 +5,185 @@ Extracted from app.py to reduce main-page complexity.
 """
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
 import streamlit as st
 
 from components.ui_helpers import divider
+from utils.data_reader import count_duplicate_rows, estimate_memory_mb
+
+
+# ---------------------------------------------------------------------------
+# Cached stats — Streamlit reruns the page on every widget interaction, so the
+# full-frame scans below are memoised per frame. The frame itself is not hashed
+# (``_df``); callers pass ``frame_key``, the persisted frame's path
+# (``st.session_state.df_path``), which is unique to one upload.
+# ---------------------------------------------------------------------------
+# Frames whose stats stay cached; matches ``load_frame``'s bound.
+_CACHE_FRAMES = 8
+
+# Rows shown in the Preview tab.
+_PREVIEW_ROWS = 100
+
+# Above this many rows, "fast preview" computes describe() on a random sample.
+_STATS_SAMPLE_ROWS = 500_000
+
+
+def _missing_by_column(df: pd.DataFrame) -> pd.Series:
+    """Per-column null counts from one contiguous bool buffer."""
+    mask = df.isna().to_numpy()
+    return pd.Series(mask.sum(axis=0), index=df.columns, dtype=np.int64)
+
+
+def _missing_cells(missing: pd.Series) -> int:
+    return int(missing.to_numpy().sum())
+
+
+@st.cache_data(show_spinner=False, max_entries=_CACHE_FRAMES)
+def _frame_stats(_df: pd.DataFrame, frame_key: str) -> tuple[pd.Series, int, float]:
+    """Run the three independent full-frame reductions concurrently.
+
+    The heavy parts execute in NumPy/pandas C code that releases the GIL, so
+    wall time approaches the slowest reduction rather than their sum.
+    """
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        f_missing = pool.submit(_missing_by_column, _df)
+        f_dups = pool.submit(count_duplicate_rows, _df)
+        f_mem = pool.submit(estimate_memory_mb, _df)
+        return f_missing.result(), f_dups.result(), f_mem.result()
+
+
+@st.cache_data(show_spinner=False, max_entries=2 * _CACHE_FRAMES)
+def _describe(_df: pd.DataFrame, frame_key: str, sample_rows: int | None = None) -> pd.DataFrame:
+    """``describe()`` on the frame, or on a seeded sample of *sample_rows* rows."""
+    df = _df
+    if sample_rows is not None and len(df) > sample_rows:
+        df = df.sample(n=sample_rows, random_state=0)
+    return df.describe(include="all").T
+
+
+def quality_counts(df: pd.DataFrame, frame_key: str) -> tuple[int, int]:
+    """``(missing_cells, duplicate_rows)`` from the cached frame stats."""
+    missing_by_col, dup_rows, _ = _frame_stats(df, frame_key)
+    return _missing_cells(missing_by_col), dup_rows
+
+
+# ---------------------------------------------------------------------------
+# Tab bodies — only the open tab is computed when Streamlit reports tab state
+# ---------------------------------------------------------------------------
+_TAB_LABELS = ["Preview", "Column Types", "Statistics", "Missing Values"]
+
+
+def _lazy_tabs(labels: list[str], key: str):
+    """``st.tabs`` that reruns on switch, so each tab's ``.open`` is known."""
+    try:
+        return st.tabs(labels, key=key, on_change="rerun")
+    except TypeError:  # Streamlit without tab state; every tab renders
+        return st.tabs(labels)
 
 
-def render_dataset_preview(df: pd.DataFrame) -> None:
-    """Render the full dataset-preview section for *df*."""
+def _is_open(tab) -> bool:
+    """``False`` only when Streamlit says the tab is hidden."""
+    return getattr(tab, "open", None) is not False
+
+
+@st.cache_resource(show_spinner=False, max_entries=_CACHE_FRAMES)
+def _preview_table(_df: pd.DataFrame, frame_key: str, rows: int = _PREVIEW_ROWS):
+    """Arrow slice of the first *rows* rows, built once per frame.
+
+    ``st.dataframe`` serialises a ``pa.Table`` straight to Arrow IPC, so
+    reruns skip the pandas-to-Arrow conversion of the preview window.
+    """
+    import pyarrow as pa
+
+    return pa.Table.from_pandas(_df.head(rows), preserve_index=True)
+
+
+def _render_preview_tab(df: pd.DataFrame, frame_key: str) -> None:
+    try:
+        data = _preview_table(df, frame_key)
+    except Exception:  # columns Arrow cannot type; let Streamlit coerce them
+        data = df.head(_PREVIEW_ROWS)
+    st.dataframe(data, width="stretch", height=320)
+
+
+def _render_dtypes_tab(df: pd.DataFrame) -> None:
+    dtype_df = pd.DataFrame(
+        {"Column": df.columns, "Type": df.dtypes.astype(str).values}
+    ).reset_index(drop=True)
+    dtype_df.index += 1
+    st.dataframe(dtype_df, width="stretch", height=320)
+
+
+def _render_stats_tab(df: pd.DataFrame, frame_key: str, fast: bool) -> None:
+    sampled = fast and len(df) > _STATS_SAMPLE_ROWS
+    try:
+        st.dataframe(
+            _describe(df, frame_key, _STATS_SAMPLE_ROWS if sampled else None),
+            width="stretch",
+            height=320,
+        )
+        if sampled:
+            st.caption(f"Statistics computed on a {_STATS_SAMPLE_ROWS:,}-row sample.")
+    except Exception:
+        st.warning("Could not generate statistics for this dataset.")
+
+
+def _render_missing_tab(df: pd.DataFrame, missing_by_col: pd.Series) -> None:
+    missing = missing_by_col[missing_by_col > 0].sort_values(ascending=False)
+    if missing.empty:
+        st.success("No missing values detected!", icon=":material/check_circle:")
+        return
+    miss_df = pd.DataFrame(
+        {
+            "Column": missing.index,
+            "Missing": missing.values,
+            "% Missing": (missing.values / len(df) * 100).round(2),
+        }
+    ).reset_index(drop=True)
+    miss_df.index += 1
+    st.dataframe(miss_df, width="stretch", height=320)
+    st.bar_chart(miss_df.set_index("Column")["% Missing"])
+
+
+def render_dataset_preview(df: pd.DataFrame, frame_key: str, *, fast: bool = True) -> None:
+    """Render the full dataset-preview section for *df*.
+
+    *frame_key* identifies the frame for the stats caches (its persisted
+    path). With *fast* enabled, statistics for very large frames are computed
+    on a sample; the metric cards always reflect the full frame.
+    """
 
     st.markdown("### Dataset Preview")
 
+    missing_by_col, dup_rows, mem_mb = _frame_stats(df, frame_key)
+
     # ---- metric cards ----
     c1, c2, c3, c4, c5 = st.columns(5)
     c1.metric("Rows", f"{len(df):,}")
     c2.metric("Columns", f"{len(df.columns):,}")
-    c3.metric("Missing Cells", f"{df.isnull().sum().sum():,}")
-    c4.metric("Duplicate Rows", f"{df.duplicated().sum():,}")
-    mem_mb = df.memory_usage(deep=True).sum() / 1024 / 1024
+    c3.metric("Missing Cells", f"{_missing_cells(missing_by_col):,}")
+    c4.metric("Duplicate Rows", f"{dup_rows:,}")
     c5.metric("Memory", f"{mem_mb:.2f} MB")
 
     # ---- tabs ----
-    tab_preview, tab_dtypes, tab_stats, tab_missing = st.tabs(
-        ["Preview", "Column Types", "Statistics", "Missing Values"]
+    tab_preview, tab_dtypes, tab_stats, tab_missing = _lazy_tabs(
+        _TAB_LABELS, key="dataset_preview_tab"
     )
 
     with tab_preview:
-        st.dataframe(df.head(100), width="stretch", height=320)
-
+        if _is_open(tab_preview):
+            _render_preview_tab(df, frame_key)
     with tab_dtypes:
-        dtype_df = pd.DataFrame(
-            {"Column": df.columns, "Type": df.dtypes.astype(str).values}
-        ).reset_index(drop=True)
-        dtype_df.index += 1
-        st.dataframe(dtype_df, width="stretch", height=320)
-
+        if _is_open(tab_dtypes):
+            _render_dtypes_tab(df)
     with tab_stats:
-        try:
-            st.dataframe(df.describe(include="all").T, width="stretch", height=320)
-        except Exception:
-            st.warning("Could not generate statistics for this dataset.")
-
+        if _is_open(tab_stats):
+            _render_stats_tab(df, frame_key, fast)
     with tab_missing:
-        missing = df.isnull().sum()
-        missing = missing[missing > 0].sort_values(ascending=False)
-        if missing.empty:
-            st.success("No missing values detected!", icon=":material/check_circle:")
-        else:
-            miss_df = pd.DataFrame(
-                {
-                    "Column": missing.index,
-                    "Missing": missing.values,
-                    "% Missing": (missing.values / len(df) * 100).round(2),
-                }
-            ).reset_index(drop=True)
-            miss_df.index += 1
-            st.dataframe(miss_df, width="stretch", height=320)
-            st.bar_chart(miss_df.set_index("Column")["% Missing"])
+        if _is_open(tab_missing):
+            _render_missing_tab(df, missing_by_col)
 
     divider()
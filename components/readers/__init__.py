@@ -1,18 +1,25 @@
 """
 Dataset reader components for different data types.
+
+Readers are imported on first access, so importing one does not load the
+others (or their heavier dependencies).
 """
-from .tabular import render_tabular_reader
-from .image_classification import render_image_classification_reader
-from .image_detection import render_image_detection_reader
-from .image_segmentation import render_image_segmentation_reader
-from .audio import render_audio_reader
-from .large_datasets import render_large_dataset_reader
+from importlib import import_module
+
+_READER_MODULES = {
+    "render_tabular_reader": ".tabular",
+    "render_image_classification_reader": ".image_classification",
+    "render_image_detection_reader": ".image_detection",
+    "render_image_segmentation_reader": ".image_segmentation",
+    "render_audio_reader": ".audio",
+    "render_large_dataset_reader": ".large_datasets",
+}
+
+__all__ = list(_READER_MODULES)
+
 
-__all__ = [
-    "render_tabular_reader",
-    "render_image_classification_reader",
-    "render_image_detection_reader",
-    "render_image_segmentation_reader",
-    "render_audio_reader",
-    "render_large_dataset_reader",
-]
+def __getattr__(name):
+    module = _READER_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module, __name__), name)
@@ -4,14 +4,15 @@ Supports: ZIP/TAR archives with folder structure, individual images, local folde
 """
 import streamlit as st
 import pandas as pd
-import zipfile
-import tarfile
-import base64
-import matplotlib.pyplot as plt
+import os
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 from pathlib import Path
 from io import BytesIO
 from components.icon_utils import icon
-from components.readers.upload_utils import persist_streamlit_upload
+from components.readers.upload_utils import persist_upload
 
 
 # ---------------------------------------------------------------------------
@@ -20,14 +21,31 @@ from components.readers.upload_utils import persist_streamlit_upload
 IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp", ".tif", ".tiff"}
 SPLIT_FOLDERS = {"train", "test", "val", "validation", "valid"}
 
+# str.endswith accepts a tuple, so one C-level call replaces a per-extension loop.
+_IMG_EXTS_TUPLE = tuple(IMAGE_EXTENSIONS)
+
+_SPLIT_FOLDERS = frozenset(SPLIT_FOLDERS)
+_NON_CLASS_FOLDERS = _SPLIT_FOLDERS | {"images", "data"}
+
 
 # ---------------------------------------------------------------------------
 # Chart helpers
 # ---------------------------------------------------------------------------
 def create_bar_chart_image(class_df, title="Class Distribution"):
-    """Create a bar chart as a downloadable PNG image buffer."""
-    fig, ax = plt.subplots(figsize=(10, max(6, len(class_df) * 0.3)))
-    colors = plt.cm.viridis([i / len(class_df) for i in range(len(class_df))])
+    """Create a bar chart as a downloadable PNG image buffer.
+
+    Uses a standalone ``Figure`` on the Agg canvas rather than pyplot, so no
+    global figure registry is touched from Streamlit's script threads.
+    """
+    # Imported here so pages that never draw a chart skip loading matplotlib.
+    from matplotlib import colormaps
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(10, max(6, len(class_df) * 0.3)))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    colors = colormaps["viridis"](np.arange(len(class_df)) / len(class_df))
     bars = ax.barh(class_df["Class"], class_df["Image Count"], color=colors)
 
     ax.set_xlabel("Image Count")
@@ -44,156 +62,286 @@ def create_bar_chart_image(class_df, title="Class Distribution"):
             fontsize=8,
         )
 
-    plt.tight_layout()
+    fig.tight_layout()
     buf = BytesIO()
-    fig.savefig(buf, format="png", dpi=150, bbox_inches="tight")
+    fig.savefig(buf, format="png", dpi=100, bbox_inches="tight")
     buf.seek(0)
-    plt.close(fig)
     return buf
 
 
 def download_button_with_icon(data, file_name, button_text="Download Chart", icon_name="download"):
-    """Create a download button with Font Awesome icon using HTML."""
+    """Create a native download button; the PNG stays server-side until clicked."""
     if isinstance(data, BytesIO):
         data = data.getvalue()
-    b64 = base64.b64encode(data).decode()
-    button_html = f"""
-    <a href="data:image/png;base64,{b64}" download="{file_name}"
-       style="display: inline-flex; align-items: center; padding: 0.4rem 0.8rem;
-              background-color: #262730; color: white; text-decoration: none;
-              border-radius: 0.5rem; font-size: 14px; border: 1px solid #4a4a5a;
-              transition: background-color 0.2s, border-color 0.2s;">
-        <i class="fa-solid fa-{icon_name}" style="margin-right: 8px;"></i>{button_text}
-    </a>
-    """
-    st.markdown(button_html, unsafe_allow_html=True)
+    st.download_button(
+        button_text,
+        icon=f":material/{icon_name}:",
+        data=data,
+        file_name=file_name,
+        mime="image/png",
+    )
 
 
 # ---------------------------------------------------------------------------
 # Archive processing (cached)
 # ---------------------------------------------------------------------------
+_COMPRESSED_MAGIC = (b"\x1f\x8b", b"BZh", b"\xfd7zXZ\x00")
+
+
+def _is_plain_tar(archive_path: str) -> bool:
+    """True when the archive is not gzip/bzip2/xz-compressed."""
+    with open(archive_path, "rb") as f:
+        head = f.read(6)
+    return not head.startswith(_COMPRESSED_MAGIC)
+
+
+def _classify_path(path_lower: str, path: str):
+    """Return ``(split, class_name)`` for an archive member, or ``None`` to skip it.
+
+    *path_lower* is ``path.lower()``, already computed for the extension
+    check: membership tests run on its segments and *path* is only split
+    when a class name needs its original casing.
+    """
+    low = path_lower.split("/")
+    # Empty segments ("a//b", leading "/") are rare; only then pay for a filter.
+    clean = "" not in low
+    if not clean:
+        low = [p for p in low if p]
+    if len(low) == 1:
+        return "all", "uncategorized"
+    last = len(low) - 1
+    for i in range(last):
+        seg = low[i]
+        if seg in _SPLIT_FOLDERS:
+            if i + 1 < last:
+                return ("validation" if seg == "valid" else seg), _segment(path, clean, i + 1)
+            break
+    if low[-2] in _NON_CLASS_FOLDERS:
+        return None
+    return "all", _segment(path, clean, -2)
+
+
+def _segment(path: str, clean: bool, index: int) -> str:
+    parts = path.split("/")
+    return parts[index] if clean else [p for p in parts if p][index]
+
+
 @st.cache_data(show_spinner="Processing ZIP archive...")
-def process_zip_archive(_archive_path: str, _cache_key: str):
+def process_zip_archive(_archive_path: str, cache_key: str):
     """Process ZIP archive and extract dataset structure (cached)."""
-    dataset_structure = {}
+    import zipfile
+
+    dataset_structure = defaultdict(lambda: defaultdict(list))
     with zipfile.ZipFile(_archive_path, "r") as zf:
         for file_path in zf.namelist():
-            if not any(file_path.lower().endswith(ext) for ext in IMAGE_EXTENSIONS):
+            path_lower = file_path.lower()
+            if not path_lower.endswith(_IMG_EXTS_TUPLE):
                 continue
-            parts = [p for p in file_path.split("/") if p]
-            if len(parts) >= 3:
-                potential_split = class_name = None
-                for i, part in enumerate(parts[:-1]):
-                    if part.lower() in SPLIT_FOLDERS:
-                        potential_split = part.lower()
-                        if potential_split == "valid":
-                            potential_split = "validation"
-                        if i + 1 < len(parts) - 1:
-                            class_name = parts[i + 1]
-                        break
-                if potential_split and class_name:
-                    dataset_structure.setdefault(potential_split, {}).setdefault(class_name, []).append(file_path)
-                    continue
-            if len(parts) >= 2:
-                class_name = parts[-2]
-                if class_name.lower() not in SPLIT_FOLDERS and class_name.lower() not in ["images", "data"]:
-                    dataset_structure.setdefault("all", {}).setdefault(class_name, []).append(file_path)
-                    continue
-            if len(parts) == 1:
-                dataset_structure.setdefault("all", {}).setdefault("uncategorized", []).append(file_path)
-    return dataset_structure
+            placed = _classify_path(path_lower, file_path)
+            if placed is not None:
+                dataset_structure[placed[0]][placed[1]].append(file_path)
+    return {split: dict(classes) for split, classes in dataset_structure.items()}
 
 
 @st.cache_data(show_spinner="Processing TAR archive...")
-def process_tar_archive(_archive_path: str, _cache_key: str, file_ext: str, file_name: str):
-    """Process TAR archive and extract dataset structure (cached)."""
-    dataset_structure = {}
-    mode = "r:gz" if ".gz" in file_name or file_ext == ".tgz" else "r"
-    with tarfile.open(_archive_path, mode) as tf:
-        for member in tf.getmembers():
+def process_tar_archive(_archive_path: str, cache_key: str, file_ext: str, file_name: str):
+    """Process TAR archive and extract dataset structure (cached).
+
+    Returns ``(dataset_structure, member_index)``. For uncompressed archives
+    ``member_index`` maps each image member to its ``(offset, size)`` so
+    ``read_tar_image`` can seek straight to the data; it is ``None`` for
+    compressed archives, which have no random access.
+    """
+    import tarfile
+
+    dataset_structure = defaultdict(lambda: defaultdict(list))
+    member_index = {} if _is_plain_tar(_archive_path) else None
+    # Structure discovery only needs headers in order, so read the archive as a
+    # forward-only stream ("r|*" also detects compression) and handle each
+    # member as it is parsed instead of collecting getmembers() up front.
+    with tarfile.open(_archive_path, "r|*") as tf:
+        for member in tf:
             if not member.isfile():
                 continue
-            if not any(member.name.lower().endswith(ext) for ext in IMAGE_EXTENSIONS):
-                continue
             file_path = member.name
-            parts = [p for p in file_path.split("/") if p]
-            if len(parts) >= 3:
-                potential_split = class_name = None
-                for i, part in enumerate(parts[:-1]):
-                    if part.lower() in SPLIT_FOLDERS:
-                        potential_split = part.lower()
-                        if potential_split == "valid":
-                            potential_split = "validation"
-                        if i + 1 < len(parts) - 1:
-                            class_name = parts[i + 1]
-                        break
-                if potential_split and class_name:
-                    dataset_structure.setdefault(potential_split, {}).setdefault(class_name, []).append(file_path)
-                    continue
-            if len(parts) >= 2:
-                class_name = parts[-2]
-                if class_name.lower() not in SPLIT_FOLDERS and class_name.lower() not in ["images", "data"]:
-                    dataset_structure.setdefault("all", {}).setdefault(class_name, []).append(file_path)
-                    continue
-            if len(parts) == 1:
-                dataset_structure.setdefault("all", {}).setdefault("uncategorized", []).append(file_path)
-    return dataset_structure
+            path_lower = file_path.lower()
+            if not path_lower.endswith(_IMG_EXTS_TUPLE):
+                continue
+            if member_index is not None and not member.issparse():
+                member_index[file_path] = (member.offset_data, member.size)
+            placed = _classify_path(path_lower, file_path)
+            if placed is not None:
+                dataset_structure[placed[0]][placed[1]].append(file_path)
+    return {split: dict(classes) for split, classes in dataset_structure.items()}, member_index
+
+
+# Archive handles kept open at once; older ones are dropped (and closed when
+# collected) as new archives are browsed.
+_OPEN_ARCHIVES = 4
+
+
+@st.cache_resource(show_spinner=False, max_entries=_OPEN_ARCHIVES)
+def _open_zip(archive_path: str, archive_key: str):
+    """One open handle per archive, so the central directory is parsed once."""
+    import zipfile
+
+    return zipfile.ZipFile(archive_path, "r")
+
+
+@st.cache_resource(show_spinner=False, max_entries=_OPEN_ARCHIVES)
+def _open_tar(archive_path: str, archive_key: str, mode: str):
+    """One open handle (plus its lock) per archive; TarFile is not thread-safe."""
+    import tarfile
+
+    return tarfile.open(archive_path, mode), threading.Lock()
 
 
 @st.cache_data(show_spinner=False)
-def read_zip_image(_archive_path: str, _cache_key: str, member_path: str) -> bytes:
-    with zipfile.ZipFile(_archive_path, "r") as zf:
-        return zf.read(member_path)
+def read_zip_image(_archive_path: str, cache_key: str, member_path: str) -> bytes:
+    return _open_zip(_archive_path, cache_key).read(member_path)
+
+
+# Preview grids are five columns wide; larger thumbnails are never shown.
+_THUMB_MAX_DIM = 256
+
+
+@st.cache_data(show_spinner=False)
+def read_zip_thumbnail(
+    _archive_path: str, cache_key: str, member_path: str, max_dim: int = _THUMB_MAX_DIM
+) -> bytes:
+    """Downscaled preview of one member, decoded straight from the ZIP stream.
+
+    JPEGs are decoded at reduced scale via ``Image.draft``, so large photos
+    never materialise at full resolution.  Falls back to the raw bytes when
+    Pillow is unavailable or cannot decode the member.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        return read_zip_image(_archive_path, cache_key, member_path)
+    try:
+        with _open_zip(_archive_path, cache_key).open(member_path) as stream:
+            img = Image.open(stream)
+            img.draft("RGB", (max_dim, max_dim))
+            img.thumbnail((max_dim, max_dim))
+            buf = BytesIO()
+            if img.mode in ("RGB", "L"):
+                img.save(buf, "JPEG", quality=75)
+            else:
+                img.save(buf, "PNG")
+            return buf.getvalue()
+    except Exception:
+        return read_zip_image(_archive_path, cache_key, member_path)
 
 
 @st.cache_data(show_spinner=False)
-def read_tar_image(_archive_path: str, _cache_key: str, file_ext: str, file_name: str, member_path: str) -> bytes:
+def read_tar_image(
+    _archive_path: str,
+    cache_key: str,
+    file_ext: str,
+    file_name: str,
+    member_path: str,
+    span: tuple | None = None,
+) -> bytes:
+    """Read one member; *span* is its ``(offset, size)`` from the scan index."""
+    if span is not None:
+        offset, size = span
+        with open(_archive_path, "rb") as f:
+            f.seek(offset)
+            return f.read(size)
     mode = "r:gz" if ".gz" in file_name or file_ext == ".tgz" else "r"
-    with tarfile.open(_archive_path, mode) as tf:
-        member = tf.getmember(member_path)
-        extracted = tf.extractfile(member)
+    # The cached handle keeps its member table, so getmember() scans once.
+    tf, lock = _open_tar(_archive_path, cache_key, mode)
+    with lock:
+        extracted = tf.extractfile(tf.getmember(member_path))
         if extracted is None:
             raise FileNotFoundError(member_path)
         return extracted.read()
 
 
+_IMG_EXTS_NO_DOT = frozenset(e[1:] for e in IMAGE_EXTENSIONS)
+_LOCAL_SKIP_FOLDERS = frozenset({"train", "test", "val", "validation", "images", "data", "__pycache__"})
+_LOCAL_SPLIT_FOLDERS = frozenset({"train", "test", "val", "validation"})
+
+
+def _list_images(folder: str) -> list:
+    """Image file paths directly inside *folder*.
+
+    ``os.scandir`` entries carry the dirent type, so ``is_file()`` needs no
+    extra ``stat`` for regular files.
+    """
+    images = []
+    with os.scandir(folder) as it:
+        for entry in it:
+            stem, _, ext = entry.name.rpartition(".")
+            if stem and ext.lower() in _IMG_EXTS_NO_DOT and entry.is_file():
+                images.append(entry.path)
+    return images
+
+
+def _subdirs(folder: str) -> list:
+    with os.scandir(folder) as it:
+        return [entry for entry in it if entry.is_dir()]
+
+
+def _scan_workers() -> int:
+    # Directory listing is syscall-bound and releases the GIL.
+    return min(32, (os.cpu_count() or 1) * 4)
+
+
 @st.cache_data(show_spinner="Scanning local folder...")
 def scan_local_folder_cached(folder_path_str):
-    """Scan local folder for image classification structure (cached)."""
-    folder_path = Path(folder_path_str)
-    classes = {}
-    for class_folder in folder_path.iterdir():
-        if class_folder.is_dir():
-            class_name = class_folder.name
-            if class_name.startswith(".") or class_name.lower() in [
-                "train", "test", "val", "validation", "images", "data", "__pycache__",
-            ]:
-                continue
-            images = [
-                str(img) for img in class_folder.iterdir()
-                if img.is_file() and img.suffix.lower() in IMAGE_EXTENSIONS
+    """Scan local folder for image classification structure (cached).
+
+    Class folders are listed concurrently; results keep directory order.
+    """
+    folder = str(Path(folder_path_str))
+    class_dirs = [
+        d for d in _subdirs(folder)
+        if not d.name.startswith(".") and d.name.lower() not in _LOCAL_SKIP_FOLDERS
+    ]
+    with ThreadPoolExecutor(max_workers=_scan_workers()) as pool:
+        listed = pool.map(_list_images, [d.path for d in class_dirs])
+        classes = {d.name: images for d, images in zip(class_dirs, listed) if images}
+        if not classes:
+            class_dirs = [
+                class_folder
+                for split_folder in _subdirs(folder)
+                if split_folder.name.lower() in _LOCAL_SPLIT_FOLDERS
+                for class_folder in _subdirs(split_folder.path)
+                if not class_folder.name.startswith(".")
             ]
-            if images:
-                classes[class_name] = images
-    if not classes:
-        for split_folder in folder_path.iterdir():
-            if split_folder.is_dir() and split_folder.name.lower() in ["train", "test", "val", "validation"]:
-                for class_folder in split_folder.iterdir():
-                    if class_folder.is_dir() and not class_folder.name.startswith("."):
-                        images = [
-                            str(img) for img in class_folder.iterdir()
-                            if img.is_file() and img.suffix.lower() in IMAGE_EXTENSIONS
-                        ]
-                        if images:
-                            classes.setdefault(class_folder.name, []).extend(images)
+            listed = pool.map(_list_images, [d.path for d in class_dirs])
+            for d, images in zip(class_dirs, listed):
+                if images:
+                    classes.setdefault(d.name, []).extend(images)
     return classes
 
 
 # ---------------------------------------------------------------------------
 # Display helpers
 # ---------------------------------------------------------------------------
-def display_split_view(dataset_structure, read_image_func):
+# Captions only need the last path component; skip building a Path per image.
+_basename = os.path.basename
+
+
+def _class_count_df(classes) -> pd.DataFrame:
+    """Class / Image Count table, largest classes first."""
+    counts = pd.Series(
+        {name: len(images) for name, images in classes.items()}, name="Image Count", dtype="int64"
+    ).sort_values(ascending=False)
+    return counts.rename_axis("Class").reset_index()
+
+
+def _split_totals(dataset_structure) -> dict:
+    """Image count per split, computed once and shared by the views."""
+    return {name: sum(map(len, split_data.values())) for name, split_data in dataset_structure.items()}
+
+
+def display_split_view(dataset_structure, read_image_func, split_totals=None):
     """Display dataset with splits (train/test/val)."""
+    if split_totals is None:
+        split_totals = _split_totals(dataset_structure)
     st.markdown(
         '<h4><i class="fa-solid fa-sitemap" style="margin-right: 8px;"></i>Dataset Splits</h4>',
         unsafe_allow_html=True,
@@ -201,9 +349,11 @@ def display_split_view(dataset_structure, read_image_func):
     split_summary = []
     for split_name in ["train", "test", "val", "validation"]:
         if split_name in dataset_structure:
-            split_data = dataset_structure[split_name]
-            split_images = sum(len(v) for v in split_data.values())
-            split_summary.append({"Split": split_name.capitalize(), "Classes": len(split_data), "Images": split_images})
+            split_summary.append({
+                "Split": split_name.capitalize(),
+                "Classes": len(dataset_structure[split_name]),
+                "Images": split_totals[split_name],
+            })
     if split_summary:
         st.dataframe(pd.DataFrame(split_summary), use_container_width=True, hide_index=True)
     split_names = [s for s in ["train", "test", "val", "validation"] if s in dataset_structure]
@@ -212,9 +362,7 @@ def display_split_view(dataset_structure, read_image_func):
         for tab, split_name in zip(tabs, split_names):
             with tab:
                 split_data = dataset_structure[split_name]
-                class_df = pd.DataFrame(
-                    {"Class": list(split_data.keys()), "Image Count": [len(v) for v in split_data.values()]}
-                ).sort_values("Image Count", ascending=False)
+                class_df = _class_count_df(split_data)
                 col1, col2 = st.columns(2)
                 with col1:
                     st.dataframe(class_df, use_container_width=True, hide_index=True)
@@ -229,14 +377,12 @@ def display_split_view(dataset_structure, read_image_func):
                     cols = st.columns(5)
                     for i, img_path in enumerate(sample_images[:num_to_show]):
                         with cols[i % 5]:
-                            st.image(read_image_func(img_path), caption=Path(img_path).name, use_container_width=True)
+                            st.image(read_image_func(img_path), caption=_basename(img_path), use_container_width=True)
 
 
 def display_unified_view(classes, read_image_func=None, is_local=False):
     """Display dataset without splits (unified view)."""
-    class_df = pd.DataFrame(
-        {"Class": list(classes.keys()), "Image Count": [len(v) for v in classes.values()]}
-    ).sort_values("Image Count", ascending=False)
+    class_df = _class_count_df(classes)
     col1, col2 = st.columns(2)
     with col1:
         st.dataframe(class_df, use_container_width=True, hide_index=True)
@@ -253,45 +399,79 @@ def display_unified_view(classes, read_image_func=None, is_local=False):
         for i, img_path in enumerate(sample_images[:num_to_show]):
             with cols[i % 5]:
                 if is_local:
-                    st.image(img_path, caption=Path(img_path).name, use_container_width=True)
+                    st.image(img_path, caption=_basename(img_path), use_container_width=True)
                 else:
-                    st.image(read_image_func(img_path), caption=Path(img_path).name, use_container_width=True)
+                    st.image(read_image_func(img_path), caption=_basename(img_path), use_container_width=True)
 
 
-def display_dataset_statistics(dataset_structure, total_images, all_classes, has_splits):
+def display_dataset_statistics(dataset_structure, total_images, all_classes, has_splits, split_totals=None):
     """Display dataset statistics in an expander."""
+    if split_totals is None:
+        split_totals = _split_totals(dataset_structure)
     with st.expander("Dataset Statistics"):
         st.write(f"- **Total Classes:** {len(all_classes)}")
         st.write(f"- **Total Images:** {total_images}")
         if has_splits:
             st.write("- **Splits:**")
             for split_name, split_data in dataset_structure.items():
-                split_images = sum(len(v) for v in split_data.values())
-                st.write(f"  - {split_name.capitalize()}: {split_images} images ({len(split_data)} classes)")
+                st.write(f"  - {split_name.capitalize()}: {split_totals[split_name]} images ({len(split_data)} classes)")
         else:
-            classes = dataset_structure.get("all", {})
-            if classes:
-                st.write(f"- **Average Images per Class:** {total_images / len(classes):.1f}")
-                st.write(f"- **Min Images in a Class:** {min(len(v) for v in classes.values())}")
-                st.write(f"- **Max Images in a Class:** {max(len(v) for v in classes.values())}")
+            lens = [len(v) for v in dataset_structure.get("all", {}).values()]
+            if lens:
+                st.write(f"- **Average Images per Class:** {total_images / len(lens):.1f}")
+                st.write(f"- **Min Images in a Class:** {min(lens)}")
+                st.write(f"- **Max Images in a Class:** {max(lens)}")
 
 
-def display_folder_structure(dataset_structure):
-    """Display folder structure visualization."""
+# Classes listed per split in the folder tree before "Show more".
+_FOLDER_STRUCT_STEP = 50
+
+
+@st.cache_data(show_spinner=False)
+def _folder_structure_html(_dataset_structure, cache_key: str, max_classes: int) -> str:
+    """Build the folder-tree HTML once per dataset (keyed on *cache_key*)."""
+    rows = []
+    for split_name, split_data in sorted(_dataset_structure.items()):
+        nested = split_name != "all"
+        if nested:
+            split_images = sum(len(v) for v in split_data.values())
+            rows.append(f'<p><i class="fa-solid fa-folder-open" style="color: #4a9eff;"></i> <strong>{split_name}/</strong> ({split_images} images)</p>')
+        indent = "margin-left: 20px;" if nested else ""
+        img_margin = "40px" if nested else "20px"
+        for class_name, images in sorted(split_data.items())[:max_classes]:
+            rows.append(f'<p style="{indent}"><i class="fa-solid fa-folder" style="color: #f0c36d;"></i> <strong>{class_name}/</strong> ({len(images)} images)</p>')
+            for img in images[:3]:
+                rows.append(f'<p style="margin-left: {img_margin};">\u2514\u2500\u2500 {_basename(img)}</p>')
+            if len(images) > 3:
+                rows.append(f'<p style="margin-left: {img_margin};">\u2514\u2500\u2500 ... and {len(images) - 3} more</p>')
+        hidden = len(split_data) - max_classes
+        if hidden > 0:
+            rows.append(f'<p style="{indent}">\u2026 {hidden} more classes</p>')
+    return "".join(rows)
+
+
+def _folder_struct_limit_key(cache_key: str) -> str:
+    # Per dataset, so a new dataset starts from the first page again.
+    return f"folder_struct_limit_{cache_key}"
+
+
+def _show_more_classes(cache_key: str) -> None:
+    limit_key = _folder_struct_limit_key(cache_key)
+    st.session_state[limit_key] = st.session_state.get(limit_key, _FOLDER_STRUCT_STEP) + _FOLDER_STRUCT_STEP
+
+
+def display_folder_structure(dataset_structure, cache_key):
+    """Display folder structure visualization, capped per split until "Show more" is pressed."""
+    max_classes = st.session_state.get(_folder_struct_limit_key(cache_key), _FOLDER_STRUCT_STEP)
     with st.expander("View Folder Structure"):
-        structure_html = ""
-        for split_name, split_data in sorted(dataset_structure.items()):
-            if split_name != "all":
-                split_images = sum(len(v) for v in split_data.values())
-                structure_html += f'<p><i class="fa-solid fa-folder-open" style="color: #4a9eff;"></i> <strong>{split_name}/</strong> ({split_images} images)</p>'
-            for class_name, images in sorted(split_data.items()):
-                indent = "margin-left: 20px;" if split_name != "all" else ""
-                structure_html += f'<p style="{indent}"><i class="fa-solid fa-folder" style="color: #f0c36d;"></i> <strong>{class_name}/</strong> ({len(images)} images)</p>'
-                for img in images[:3]:
-                    structure_html += f'<p style="margin-left: {"40px" if split_name != "all" else "20px"};">\u2514\u2500\u2500 {Path(img).name}</p>'
-                if len(images) > 3:
-                    structure_html += f'<p style="margin-left: {"40px" if split_name != "all" else "20px"};">\u2514\u2500\u2500 ... and {len(images) - 3} more</p>'
-        st.markdown(structure_html, unsafe_allow_html=True)
+        st.markdown(_folder_structure_html(dataset_structure, cache_key, max_classes), unsafe_allow_html=True)
+        if any(len(split_data) > max_classes for split_data in dataset_structure.values()):
+            st.button(
+                "Show more",
+                key=f"folder_struct_more_{cache_key}",
+                on_click=_show_more_classes,
+                args=(cache_key,),
+            )
 
 
 # ---------------------------------------------------------------------------
@@ -307,30 +487,34 @@ def render_archive_upload():
     if uploaded_archive is not None:
         file_ext = Path(uploaded_archive.name).suffix.lower()
         file_name = uploaded_archive.name.lower()
-        archive_path, archive_md5 = persist_streamlit_upload(uploaded_archive, filename=uploaded_archive.name)
+        archive_path, archive_key = persist_upload(uploaded_archive)
         try:
             if file_ext == ".zip":
-                dataset_structure = process_zip_archive(archive_path, archive_md5)
-                read_image_func = lambda p: read_zip_image(archive_path, archive_md5, p)
+                dataset_structure = process_zip_archive(archive_path, archive_key)
+                read_image_func = lambda p: read_zip_thumbnail(archive_path, archive_key, p)
             elif ".tar" in file_name or file_ext == ".tgz":
-                dataset_structure = process_tar_archive(archive_path, archive_md5, file_ext, file_name)
-                read_image_func = lambda p: read_tar_image(archive_path, archive_md5, file_ext, file_name, p)
+                dataset_structure, member_index = process_tar_archive(archive_path, archive_key, file_ext, file_name)
+                read_image_func = lambda p: read_tar_image(
+                    archive_path, archive_key, file_ext, file_name, p,
+                    member_index.get(p) if member_index else None,
+                )
             else:
                 st.error(f"Unsupported archive format: {file_ext}")
                 return
             if dataset_structure:
-                total_images = sum(len(imgs) for sd in dataset_structure.values() for imgs in sd.values())
+                split_totals = _split_totals(dataset_structure)
+                total_images = sum(split_totals.values())
                 all_classes = set()
                 for sd in dataset_structure.values():
                     all_classes.update(sd.keys())
                 has_splits = len(dataset_structure) > 1 or "all" not in dataset_structure
                 st.success(f"Found {len(all_classes)} classes with {total_images} total images")
                 if has_splits:
-                    display_split_view(dataset_structure, read_image_func)
+                    display_split_view(dataset_structure, read_image_func, split_totals)
                 else:
                     display_unified_view(dataset_structure.get("all", {}), read_image_func, is_local=False)
-                display_dataset_statistics(dataset_structure, total_images, all_classes, has_splits)
-                display_folder_structure(dataset_structure)
+                display_dataset_statistics(dataset_structure, total_images, all_classes, has_splits, split_totals)
+                display_folder_structure(dataset_structure, archive_key)
             else:
                 st.warning("No valid image folder structure found in archive.")
                 st.info("Expected structure: archive/class_name/image.jpg or archive/split/class_name/image.jpg")
@@ -338,6 +522,21 @@ def render_archive_upload():
             st.error(f"Error reading archive: {e}")
 
 
+def _display_local_dataset(classes, folder_path: str) -> None:
+    """Views, statistics and folder tree for a scanned local folder."""
+    lens = [len(v) for v in classes.values()]
+    total_images = sum(lens)
+    st.success(f"Found {len(classes)} classes with {total_images} total images")
+    display_unified_view(classes, is_local=True)
+    with st.expander("Dataset Statistics"):
+        st.write(f"- **Total Classes:** {len(classes)}")
+        st.write(f"- **Total Images:** {total_images}")
+        st.write(f"- **Average Images per Class:** {total_images / len(lens):.1f}")
+        st.write(f"- **Min Images in a Class:** {min(lens)}")
+        st.write(f"- **Max Images in a Class:** {max(lens)}")
+    display_folder_structure({"all": classes}, f"local:{folder_path}")
+
+
 def render_local_folder():
     """Render local folder path interface."""
     st.write("Enter the path to your local dataset folder.")
@@ -353,35 +552,18 @@ def render_local_folder():
             try:
                 classes = scan_local_folder_cached(folder_path)
                 if classes:
-                    total_images = sum(len(v) for v in classes.values())
-                    st.success(f"Found {len(classes)} classes with {total_images} total images")
                     st.session_state["cv_classes"] = classes
                     st.session_state["cv_folder_path"] = folder_path
-                    display_unified_view(classes, is_local=True)
-                    with st.expander("Dataset Statistics"):
-                        st.write(f"- **Total Classes:** {len(classes)}")
-                        st.write(f"- **Total Images:** {total_images}")
-                        st.write(f"- **Average Images per Class:** {total_images / len(classes):.1f}")
-                        st.write(f"- **Min Images in a Class:** {min(len(v) for v in classes.values())}")
-                        st.write(f"- **Max Images in a Class:** {max(len(v) for v in classes.values())}")
-                    with st.expander("View Folder Structure"):
-                        structure_html = ""
-                        for class_name, images in sorted(classes.items()):
-                            structure_html += f'<p><i class="fa-solid fa-folder" style="color: #f0c36d;"></i> <strong>{class_name}/</strong> ({len(images)} images)</p>'
-                            for img in images[:3]:
-                                structure_html += f'<p style="margin-left: 20px;">\u2514\u2500\u2500 {Path(img).name}</p>'
-                            if len(images) > 3:
-                                structure_html += f'<p style="margin-left: 20px;">\u2514\u2500\u2500 ... and {len(images) - 3} more</p>'
-                        st.markdown(structure_html, unsafe_allow_html=True)
+                    _display_local_dataset(classes, folder_path)
                 else:
                     st.warning("No valid image folder structure found.")
                     st.info("Expected structure: `folder/class_name/image.jpg`")
             except Exception as e:
                 st.error(f"Error reading folder: {e}")
     elif "cv_classes" in st.session_state and st.session_state.get("cv_folder_path") == folder_path:
-        classes = st.session_state["cv_classes"]
-        total_images = sum(len(v) for v in classes.values())
-        st.success(f"Loaded {len(classes)} classes with {total_images} total images")
+        # Widget interactions (e.g. "Show more") rerun without the button
+        # press, so the loaded dataset is rendered again from session state.
+        _display_local_dataset(st.session_state["cv_classes"], folder_path)
 
 
 def render_individual_images():
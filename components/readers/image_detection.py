@@ -8,14 +8,41 @@ import json
 from components.icon_utils import icon
 
 
+def _upload_key(file) -> str:
+    """Stable cache key for an uploaded file (one per upload, not per rerun)."""
+    return getattr(file, "file_id", None) or f"{file.name}:{file.size}"
+
+
+@st.cache_resource(show_spinner="Parsing annotations...", max_entries=4)
+def _load_coco(_file, file_key: str):
+    # Held as a resource (not copied per rerun); callers only read it.
+    _file.seek(0)
+    try:
+        import orjson
+    except ImportError:
+        return json.load(_file)
+    return orjson.loads(_file.read())
+
+
 def parse_coco_annotations(annotation_file):
-    """Parse COCO format JSON annotations."""
-    return json.load(annotation_file)
+    """Parse COCO format JSON annotations (cached per upload)."""
+    return _load_coco(annotation_file, _upload_key(annotation_file))
+
+
+@st.cache_data(show_spinner="Parsing annotations...", max_entries=4)
+def _load_csv(_file, file_key: str) -> pd.DataFrame:
+    _file.seek(0)
+    try:
+        return pd.read_csv(_file, engine="pyarrow")
+    except (ImportError, ValueError):
+        # pyarrow missing, or an option/dialect its reader rejects
+        _file.seek(0)
+        return pd.read_csv(_file)
 
 
 def parse_csv_annotations(annotation_file):
-    """Parse CSV format annotations."""
-    return pd.read_csv(annotation_file)
+    """Parse CSV format annotations (cached per upload)."""
+    return _load_csv(annotation_file, _upload_key(annotation_file))
 
 
 def display_coco_summary(annotations):
@@ -4,24 +4,56 @@ Supports: Original images, mask images, and optional JSON metadata
 """
 import streamlit as st
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from components.icon_utils import icon
 
 
+# Preview cards are half the page wide; nothing larger is ever visible.
+_PREVIEW_MAX_DIM = 512
+
+
+def _preview_image(uploaded, *, is_mask: bool = False):
+    """Downscaled image for a preview card, or *uploaded* itself on failure.
+
+    JPEGs are decoded at reduced scale via ``Image.draft``; masks are resized
+    with nearest-neighbour so label values survive.
+    """
+    try:
+        from PIL import Image
+
+        uploaded.seek(0)
+        img = Image.open(uploaded)
+        img.draft("RGB" if not is_mask else img.mode, (_PREVIEW_MAX_DIM, _PREVIEW_MAX_DIM))
+        resample = Image.Resampling.NEAREST if is_mask else Image.Resampling.BICUBIC
+        img.thumbnail((_PREVIEW_MAX_DIM, _PREVIEW_MAX_DIM), resample)
+        return img
+    except Exception:
+        uploaded.seek(0)
+        return uploaded
+
+
 def display_image_mask_pairs(original_images, mask_images, num_preview=3):
     """Display side-by-side image and mask previews."""
     with st.expander("Preview Image-Mask Pairs"):
         num_preview = min(num_preview, len(original_images), len(mask_images))
+        if num_preview <= 0:
+            return
+        # Pillow releases the GIL while decoding, so thumbnails build in parallel.
+        with ThreadPoolExecutor(max_workers=min(8, num_preview * 2)) as pool:
+            originals = list(pool.map(_preview_image, original_images[:num_preview]))
+            masks = list(pool.map(partial(_preview_image, is_mask=True), mask_images[:num_preview]))
         for i in range(num_preview):
             cols = st.columns(2)
             with cols[0]:
                 st.image(
-                    original_images[i],
+                    originals[i],
                     caption=f"Image: {original_images[i].name}",
                     use_container_width=True,
                 )
             with cols[1]:
                 st.image(
-                    mask_images[i],
+                    masks[i],
                     caption=f"Mask: {mask_images[i].name}",
                     use_container_width=True,
                 )
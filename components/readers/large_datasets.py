@@ -7,36 +7,38 @@ import pandas as pd
 import zipfile
 import tarfile
 import pickle
+import reprlib
 import os
 from pathlib import Path
 from components.icon_utils import icon
-from components.readers.upload_utils import persist_streamlit_upload
+from components.readers.upload_utils import persist_upload
 
 
 # ---------------------------------------------------------------------------
 # HDF5
 # ---------------------------------------------------------------------------
 @st.cache_data(show_spinner="Reading HDF5 file structure...")
-def get_hdf5_structure(_file_path: str, _cache_key: str):
+def get_hdf5_structure(_file_path: str, cache_key: str):
     """Extract HDF5 file structure (cached)."""
     try:
         import h5py
 
         with h5py.File(_file_path, "r") as hf:
-
-            def _walk(group, prefix=""):
-                items = []
-                for key in group.keys():
-                    item = group[key]
-                    if isinstance(item, h5py.Dataset):
-                        items.append(
-                            {"Key": prefix + key, "Type": "Dataset", "Shape": str(item.shape), "Dtype": str(item.dtype)}
-                        )
-                    else:
-                        items.extend(_walk(item, prefix + key + "/"))
-                return items
-
-            return {"success": True, "structure": _walk(hf)}
+            # One C-driven traversal; columns are filled directly for the table.
+            keys, types, shapes, dtypes = [], [], [], []
+
+            def _collect(name, obj):
+                if isinstance(obj, h5py.Dataset):
+                    keys.append(name)
+                    types.append("Dataset")
+                    shapes.append(str(obj.shape))
+                    dtypes.append(str(obj.dtype))
+
+            hf.visititems(_collect)
+            return {
+                "success": True,
+                "structure": {"Key": keys, "Type": types, "Shape": shapes, "Dtype": dtypes},
+            }
     except ImportError:
         return {"success": False, "error": "h5py not installed. Run: pip install h5py"}
     except Exception as e:
@@ -56,11 +58,26 @@ def read_hdf5_file(file_path: str, cache_key: str):
 # ---------------------------------------------------------------------------
 # Pickle
 # ---------------------------------------------------------------------------
+def _preview_repr() -> reprlib.Repr:
+    """Bounded repr: large containers are elided instead of fully stringified."""
+    r = reprlib.Repr()
+    r.maxlevel = 3
+    r.maxdict = r.maxlist = r.maxtuple = r.maxset = 20
+    r.maxstring = 200
+    r.maxother = 1000
+    return r
+
+
 @st.cache_data(show_spinner="Reading Pickle file...")
-def get_pickle_data(_file_bytes):
-    """Load Pickle file data (cached)."""
+def get_pickle_data(_file_path: str, cache_key: str):
+    """Load Pickle file data (cached).
+
+    Unpickles straight from the persisted file, so the raw bytes are never
+    held in memory alongside the loaded object.
+    """
     try:
-        data = pickle.loads(_file_bytes)
+        with open(_file_path, "rb", buffering=1 << 20) as f:
+            data = pickle.load(f)
         result = {"success": True, "type": type(data).__name__}
         if isinstance(data, pd.DataFrame):
             result["is_dataframe"] = True
@@ -69,21 +86,21 @@ def get_pickle_data(_file_bytes):
         elif isinstance(data, dict):
             result["is_dict"] = True
             result["keys"] = list(data.keys())
-            result["preview"] = str(data)[:5000]
+            result["preview"] = _preview_repr().repr(data)[:5000]
         elif isinstance(data, (list, tuple)):
             result["is_sequence"] = True
             result["length"] = len(data)
             result["first_type"] = type(data[0]).__name__ if data else "N/A"
         else:
-            result["preview"] = str(data)[:1000]
+            result["preview"] = _preview_repr().repr(data)[:1000]
         return result
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
-def read_pickle_file(file_bytes):
+def read_pickle_file(file_path: str, cache_key: str):
     """Read and display Pickle file contents."""
-    result = get_pickle_data(file_bytes)
+    result = get_pickle_data(file_path, cache_key)
     if not result["success"]:
         st.error(f"Error loading pickle: {result['error']}")
         return
@@ -107,17 +124,16 @@ def read_pickle_file(file_bytes):
 # ZIP
 # ---------------------------------------------------------------------------
 @st.cache_data(show_spinner="Reading ZIP file contents...")
-def get_zip_contents(_file_path: str, _cache_key: str):
+def get_zip_contents(_file_path: str, cache_key: str):
     """Extract ZIP file contents info (cached)."""
     with zipfile.ZipFile(_file_path, "r") as zf:
-        file_list = zf.namelist()
-        file_info = []
-        for f in file_list[:100]:
-            info = zf.getinfo(f)
-            file_info.append(
-                {"Filename": f, "Size (KB)": round(info.file_size / 1024, 2), "Compressed (KB)": round(info.compress_size / 1024, 2)}
-            )
-        return {"total": len(file_list), "info": file_info}
+        # infolist() is the parsed central directory itself; no per-name lookups.
+        infos = zf.infolist()
+        file_info = [
+            {"Filename": i.filename, "Size (KB)": round(i.file_size / 1024, 2), "Compressed (KB)": round(i.compress_size / 1024, 2)}
+            for i in infos[:100]
+        ]
+        return {"total": len(infos), "info": file_info}
 
 
 def read_zip_file(file_path: str, cache_key: str):
@@ -132,25 +148,48 @@ def read_zip_file(file_path: str, cache_key: str):
 # ---------------------------------------------------------------------------
 # TAR
 # ---------------------------------------------------------------------------
+_TAR_PREVIEW_MEMBERS = 100
+
+
 @st.cache_data(show_spinner="Reading TAR file contents...")
-def get_tar_contents(_file_path: str, _cache_key: str, file_ext: str, file_name: str):
-    """Extract TAR file contents info (cached)."""
-    mode = "r:gz" if ".gz" in file_name or file_ext == ".tgz" else "r"
-    with tarfile.open(_file_path, mode) as tf:
-        members = tf.getmembers()
-        file_info = []
-        for m in members[:100]:
+def get_tar_contents(_file_path: str, cache_key: str, file_ext: str, file_name: str):
+    """Extract the first TAR members' info (cached).
+
+    Headers are read as a stream and reading stops after the preview, so
+    latency no longer depends on archive size. ``total`` is ``None`` when
+    more members follow; ``count_tar_members`` counts them on demand.
+    """
+    file_info = []
+    with tarfile.open(_file_path, "r|*") as tf:
+        for m in tf:
+            if len(file_info) == _TAR_PREVIEW_MEMBERS:
+                return {"total": None, "info": file_info}
             file_info.append({"Filename": m.name, "Size (KB)": round(m.size / 1024, 2), "Type": "Dir" if m.isdir() else "File"})
-        return {"total": len(members), "info": file_info}
+    return {"total": len(file_info), "info": file_info}
+
+
+@st.cache_data(show_spinner="Counting TAR members...")
+def count_tar_members(_file_path: str, cache_key: str) -> int:
+    """Full member count; walks every header (decompressing if needed)."""
+    with tarfile.open(_file_path, "r|*") as tf:
+        return sum(1 for _ in tf)
 
 
 def read_tar_file(file_path: str, cache_key: str, file_ext: str, file_name: str):
     """Read and display TAR file contents."""
     result = get_tar_contents(file_path, cache_key, file_ext, file_name)
-    st.success(f"TAR file loaded! Contains {result['total']} files")
+    total = result["total"]
+    if total is None:
+        st.success(f"TAR file loaded! Contains {_TAR_PREVIEW_MEMBERS}+ files")
+    else:
+        st.success(f"TAR file loaded! Contains {total} files")
     st.dataframe(pd.DataFrame(result["info"]), use_container_width=True)
-    if result["total"] > 100:
-        st.info(f"Showing first 100 of {result['total']} files.")
+    if total is None:
+        if st.button("Count all files", key=f"tar_count_{cache_key}"):
+            total = count_tar_members(file_path, cache_key)
+            st.info(f"Showing first {_TAR_PREVIEW_MEMBERS} of {total} files.")
+        else:
+            st.info(f"Showing first {_TAR_PREVIEW_MEMBERS} files.")
 
 
 # ---------------------------------------------------------------------------
@@ -173,7 +212,7 @@ def render_large_dataset_reader():
     if uploaded_file is not None:
         file_ext = Path(uploaded_file.name).suffix.lower()
         file_name = uploaded_file.name.lower()
-        file_path, cache_key = persist_streamlit_upload(uploaded_file, filename=uploaded_file.name)
+        file_path, cache_key = persist_upload(uploaded_file)
         file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
 
         try:
@@ -184,8 +223,7 @@ def render_large_dataset_reader():
                     st.warning(f"Pickle file is {file_size_mb:.1f} MB. Loading it will consume a lot of RAM and may crash the app.")
                     if not st.checkbox("Load anyway (may be slow / crash)", value=False):
                         return
-                with open(file_path, "rb") as f:
-                    read_pickle_file(f.read())
+                read_pickle_file(file_path, cache_key)
             elif file_ext == ".zip":
                 read_zip_file(file_path, cache_key)
             elif ".tar" in file_name or file_ext in [".tgz"]:
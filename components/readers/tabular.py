@@ -4,60 +4,77 @@ Supports: CSV, TSV, XLSX, JSON, Parquet, TXT
 """
 import streamlit as st
 import pandas as pd
-import hashlib
 from pathlib import Path
 from components.icon_utils import icon
-
-
-def get_file_hash(uploaded_file):
-    """Generate a hash for the uploaded file to use as cache key."""
-    file_bytes = uploaded_file.getvalue()
-    return hashlib.md5(file_bytes).hexdigest()
+from components.readers.upload_utils import persist_upload
+from utils.data_reader import read_delimited, read_excel
 
 
 @st.cache_data(show_spinner="Reading CSV file...")
-def read_csv_file(_file_bytes, delimiter=","):
+def read_csv_file(_file_path: str, cache_key: str, delimiter=","):
     """Read CSV file with custom delimiter (cached)."""
-    from io import BytesIO
-    return pd.read_csv(BytesIO(_file_bytes), delimiter=delimiter)
+    return read_delimited(_file_path, delimiter)
 
 
 @st.cache_data(show_spinner="Reading TSV file...")
-def read_tsv_file(_file_bytes):
+def read_tsv_file(_file_path: str, cache_key: str):
     """Read TSV file (cached)."""
-    from io import BytesIO
-    return pd.read_csv(BytesIO(_file_bytes), delimiter="\t")
+    return read_delimited(_file_path, "\t")
 
 
 @st.cache_data(show_spinner="Reading Excel file...")
-def read_excel_file(_file_bytes, sheet_name=None):
+def read_excel_file(_file_path: str, cache_key: str, sheet_name=None):
     """Read Excel file with optional sheet name (cached)."""
-    from io import BytesIO
-    return pd.read_excel(BytesIO(_file_bytes), sheet_name=sheet_name if sheet_name else 0)
+    return read_excel(_file_path, sheet_name if sheet_name else 0)
 
 
 @st.cache_data(show_spinner="Reading JSON file...")
-def read_json_file(_file_bytes, orient="records"):
+def read_json_file(_file_path: str, cache_key: str, orient="records"):
     """Read JSON file with specified orientation (cached)."""
-    from io import BytesIO
-    return pd.read_json(BytesIO(_file_bytes), orient=orient)
+    return pd.read_json(_file_path, orient=orient)
 
 
 @st.cache_data(show_spinner="Reading Parquet file...")
-def read_parquet_file(_file_bytes):
-    """Read Parquet file (cached)."""
-    from io import BytesIO
-    return pd.read_parquet(BytesIO(_file_bytes))
+def read_parquet_file(_file_path: str, cache_key: str):
+    """Read Parquet file (cached).
+
+    The persisted file is memory-mapped and converted column by column, so
+    the Arrow buffers are released as the frame is built.
+    """
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        return pd.read_parquet(_file_path)
+    table = pq.read_table(_file_path, memory_map=True, use_threads=True)
+    return table.to_pandas(self_destruct=True, split_blocks=True)
 
 
 @st.cache_data(show_spinner="Reading TXT file...")
-def read_txt_file(_file_bytes, delimiter=","):
+def read_txt_file(_file_path: str, cache_key: str, delimiter=","):
     """Read TXT file with custom delimiter (cached)."""
-    from io import BytesIO
-    return pd.read_csv(BytesIO(_file_bytes), delimiter=delimiter)
+    return read_delimited(_file_path, delimiter)
+
+
+@st.cache_data(show_spinner=False)
+def _describe(_df: pd.DataFrame, cache_key: str, variant: str) -> pd.DataFrame:
+    """``describe()`` once per upload (and reader option), not once per rerun."""
+    return _df.describe(include="all")
+
 
+def _lazy_expander(label: str, key: str):
+    """``st.expander`` that reruns on toggle, so its ``.open`` state is known."""
+    try:
+        return st.expander(label, key=key, on_change="rerun")
+    except TypeError:  # Streamlit without expander state; body always renders
+        return st.expander(label)
 
-def display_dataframe_info(df):
+
+def _is_open(container) -> bool:
+    """``False`` only when Streamlit says the expander is collapsed."""
+    return getattr(container, "open", None) is not False
+
+
+def display_dataframe_info(df, cache_key: str = "", variant: str = ""):
     """Display DataFrame metrics and preview."""
     st.success(f"Dataset loaded! Shape: {df.shape}")
 
@@ -70,19 +87,28 @@ def display_dataframe_info(df):
     st.write("**Preview (first 10 rows):**")
     st.dataframe(df.head(10), use_container_width=True)
 
-    with st.expander("Column Information"):
-        col_info = pd.DataFrame(
-            {
-                "Column": df.columns,
-                "Type": df.dtypes.values,
-                "Non-Null": df.count().values,
-                "Null": df.isnull().sum().values,
-            }
-        )
-        st.dataframe(col_info, use_container_width=True)
-
-    with st.expander("Summary Statistics"):
-        st.write(df.describe(include="all"))
+    # Both panels scan the whole frame, so they are computed only while open.
+    col_exp = _lazy_expander("Column Information", key="tabular_col_info")
+    with col_exp:
+        if _is_open(col_exp):
+            nulls = df.isna().sum().to_numpy()
+            col_info = pd.DataFrame(
+                {
+                    "Column": df.columns,
+                    "Type": df.dtypes.values,
+                    "Non-Null": df.shape[0] - nulls,
+                    "Null": nulls,
+                }
+            )
+            st.dataframe(col_info, use_container_width=True)
+
+    stats_exp = _lazy_expander("Summary Statistics", key="tabular_stats")
+    with stats_exp:
+        if _is_open(stats_exp):
+            if cache_key:
+                st.write(_describe(df, cache_key, variant))
+            else:
+                st.write(df.describe(include="all"))
 
 
 def render_tabular_reader():
@@ -97,35 +123,42 @@ def render_tabular_reader():
 
     if uploaded_file is not None:
         file_ext = Path(uploaded_file.name).suffix.lower()
-        file_bytes = uploaded_file.getvalue()
+        # Readers parse from disk; the content digest keys their caches.
+        file_path, cache_key = persist_upload(uploaded_file)
 
         try:
             df = None
+            # Reader options that change the parsed frame for the same upload.
+            variant = ""
 
             if file_ext == ".csv":
                 delimiter = st.text_input("CSV Delimiter", ",")
-                df = read_csv_file(file_bytes, delimiter=delimiter)
+                df = read_csv_file(file_path, cache_key, delimiter=delimiter)
+                variant = delimiter
             elif file_ext == ".tsv":
-                df = read_tsv_file(file_bytes)
+                df = read_tsv_file(file_path, cache_key)
             elif file_ext in [".xlsx", ".xls"]:
                 sheet_name = st.text_input("Sheet name (leave empty for first sheet)", "")
-                df = read_excel_file(file_bytes, sheet_name=sheet_name)
+                df = read_excel_file(file_path, cache_key, sheet_name=sheet_name)
+                variant = sheet_name
             elif file_ext == ".json":
                 json_orient = st.selectbox(
                     "JSON Orient",
                     ["records", "columns", "index", "split", "table"],
                 )
-                df = read_json_file(file_bytes, orient=json_orient)
+                df = read_json_file(file_path, cache_key, orient=json_orient)
+                variant = json_orient
             elif file_ext == ".parquet":
-                df = read_parquet_file(file_bytes)
+                df = read_parquet_file(file_path, cache_key)
             elif file_ext == ".txt":
                 delimiter = st.text_input("TXT Delimiter", ",")
-                df = read_txt_file(file_bytes, delimiter=delimiter)
+                df = read_txt_file(file_path, cache_key, delimiter=delimiter)
+                variant = delimiter
             else:
                 st.error(f"Unsupported file format: {file_ext}")
 
             if df is not None:
-                display_dataframe_info(df)
+                display_dataframe_info(df, cache_key, variant)
 
         except Exception as e:
             st.error(f"Error reading file: {e}")
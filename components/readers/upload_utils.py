@@ -4,22 +4,58 @@ Streamlit upload persistence utilities.
 from __future__ import annotations
 
 import hashlib
+import io
+import mmap
+import os
 import tempfile
 from pathlib import Path
 from typing import Tuple
 
+import streamlit as st
+
+
+def _new_hasher():
+    """Content hasher for cache keys: xxh3-128 if installed, else BLAKE2b-128.
+
+    The digest only keys caches, so a non-cryptographic hash is fine and both
+    options outrun MD5 on large uploads.
+    """
+    try:
+        import xxhash
+    except ImportError:
+        return hashlib.blake2b(digest_size=16)
+    return xxhash.xxh3_128()
+
+
+def _real_fileno(file_obj) -> int | None:
+    """OS file descriptor behind *file_obj*, or ``None`` for in-memory buffers."""
+    try:
+        return file_obj.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
+def _sendfile_copy(src_fd: int, dst_fd: int, size: int) -> None:
+    """Copy *size* bytes in-kernel; the GIL is released for the whole transfer."""
+    offset = 0
+    while offset < size:
+        sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+        if sent == 0:
+            break
+        offset += sent
+
 
 def persist_streamlit_upload(
     uploaded_file,
     *,
     filename: str,
     target_dir: str = "uploads",
-    chunk_size: int = 8 * 1024 * 1024,
+    chunk_size: int = 16 * 1024 * 1024,
 ) -> Tuple[str, str]:
     """Persist a Streamlit UploadedFile to disk without calling ``.getvalue()``.
 
     Returns:
-        ``(path, md5_hex)``
+        ``(path, digest_hex)`` where the digest is a 128-bit content hash
     """
     Path(target_dir).mkdir(parents=True, exist_ok=True)
 
@@ -27,7 +63,7 @@ def persist_streamlit_upload(
     if not suffix:
         suffix = ".bin"
 
-    md5 = hashlib.md5()
+    hasher = _new_hasher()
 
     try:
         uploaded_file.seek(0)
@@ -35,12 +71,41 @@ def persist_streamlit_upload(
         pass
 
     with tempfile.NamedTemporaryFile(delete=False, suffix=suffix, dir=target_dir) as tmp:
-        while True:
-            chunk = uploaded_file.read(chunk_size)
-            if not chunk:
-                break
-            md5.update(chunk)
-            tmp.write(chunk)
+        getbuffer = getattr(uploaded_file, "getbuffer", None)
+        readinto = getattr(uploaded_file, "readinto", None)
+        src_fd = _real_fileno(uploaded_file) if hasattr(os, "sendfile") else None
+        if src_fd is not None:
+            # Disk-backed source: hash a read-only map of it and let the kernel
+            # move the bytes, so nothing is copied through Python buffers.
+            size = os.fstat(src_fd).st_size
+            if size:
+                with mmap.mmap(src_fd, 0, access=mmap.ACCESS_READ) as mm:
+                    hasher.update(mm)
+                _sendfile_copy(src_fd, tmp.fileno(), size)
+        elif getbuffer is not None:
+            # UploadedFile is a BytesIO: its bytes are already in memory, so
+            # hash and write them through one zero-copy view, with no chunk loop.
+            with getbuffer() as view:
+                hasher.update(view)
+                tmp.write(view)
+        elif readinto is not None:
+            # Refill one buffer instead of allocating a new bytes per chunk;
+            # hashing and writing both read straight from the memoryview.
+            buf = bytearray(chunk_size)
+            view = memoryview(buf)
+            while True:
+                n = readinto(buf)
+                if not n:
+                    break
+                hasher.update(view[:n])
+                tmp.write(view[:n])
+        else:
+            while True:
+                chunk = uploaded_file.read(chunk_size)
+                if not chunk:
+                    break
+                hasher.update(chunk)
+                tmp.write(chunk)
 
         tmp_path = tmp.name
 
@@ -49,4 +114,44 @@ def persist_streamlit_upload(
     except Exception:
         pass
 
-    return tmp_path, md5.hexdigest()
+    return tmp_path, hasher.hexdigest()
+
+
+def upload_key(uploaded_file) -> str:
+    """Identity of one upload, for keying process-wide caches.
+
+    Streamlit gives every upload its own ``file_id``, so two sessions' (or two
+    same-sized) ``data.csv`` files never share a key. Without one, the
+    content hash is used instead.
+    """
+    file_id = getattr(uploaded_file, "file_id", None)
+    if file_id:
+        return file_id
+    hasher = _new_hasher()
+    uploaded_file.seek(0)
+    getbuffer = getattr(uploaded_file, "getbuffer", None)
+    if getbuffer is not None:
+        with getbuffer() as view:
+            hasher.update(view)
+    else:
+        for chunk in iter(lambda: uploaded_file.read(16 * 1024 * 1024), b""):
+            hasher.update(chunk)
+        uploaded_file.seek(0)
+    return hasher.hexdigest()
+
+
+@st.cache_resource(show_spinner="Saving upload...", max_entries=16)
+def _persist_once(_uploaded_file, key: str, filename: str, size: int) -> Tuple[str, str]:
+    return persist_streamlit_upload(_uploaded_file, filename=filename)
+
+
+def persist_upload(uploaded_file) -> Tuple[str, str]:
+    """``persist_streamlit_upload`` run once per upload rather than once per rerun.
+
+    Returns:
+        ``(path, digest_hex)``; pass the digest to cached readers as a plain
+        (non-underscore) argument so Streamlit keys the cache on it.
+    """
+    return _persist_once(
+        uploaded_file, upload_key(uploaded_file), uploaded_file.name, uploaded_file.size
+    )
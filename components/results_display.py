@@ -11,17 +11,22 @@ from typing import Dict
 
 import pandas as pd
 import streamlit as st
+from streamlit.errors import StreamlitAPIException
 
+from components.dataset_preview import quality_counts
 from components.ui_helpers import divider, escape_html, markdown_to_html
 
 
 # ---------------------------------------------------------------------------
 # Quality helpers
 # ---------------------------------------------------------------------------
-def _assess_quality(df: pd.DataFrame) -> dict:
-    """Return quality metrics and a boolean ``has_issues`` flag."""
-    missing = int(df.isnull().sum().sum())
-    duplicates = int(df.duplicated().sum())
+def _assess_quality(df: pd.DataFrame, frame_key: str) -> dict:
+    """Return quality metrics and a boolean ``has_issues`` flag.
+
+    Shares the preview's cached scan, so reruns (and the preview's own metric
+    cards) do not repeat the full-frame null and duplicate passes.
+    """
+    missing, duplicates = quality_counts(df, frame_key)
     has_issues = missing > 0 or duplicates > 0
     return {"missing": missing, "duplicates": duplicates, "has_issues": has_issues}
 
@@ -31,9 +36,8 @@ def _quality_class(has_issues: bool) -> str:
     return "quality-bad" if has_issues else "quality-good"
 
 
-def _render_section_html(body_md: str, css_class: str) -> None:
-    """Render markdown *body_md* inside a styled ``<div>``."""
-    html = markdown_to_html(body_md) if body_md else ""
+def _render_section_html(html: str, css_class: str) -> None:
+    """Render converted section *html* inside a styled ``<div>``."""
     st.markdown(
         f'<div class="{css_class}">{html}</div>',
         unsafe_allow_html=True,
@@ -45,6 +49,7 @@ def render_results(
     *,
     uploaded_file_name: str,
     df: pd.DataFrame,
+    frame_key: str,
     show_rag_debug: bool = False,
 ) -> None:
     """Render all agent-result panels, the combined report, and downloads.
@@ -56,7 +61,7 @@ def render_results(
     - Quality Assessment → green if clean, red if issues remain
     """
 
-    quality = _assess_quality(df)
+    quality = _assess_quality(df, frame_key)
     eval_class = _quality_class(quality["has_issues"])
 
     divider()
@@ -75,32 +80,33 @@ def render_results(
         [":material/list_alt: Overview", ":material/search: Anomaly Analysis", ":material/build: Recommendations", ":material/trending_up: Quality Assessment"]
     )
 
-    with tab_overview:
-        _render_section_html(result.get("overview", ""), "quality-neutral")
-    with tab_analysis:
-        _render_section_html(result.get("analysis", ""), "quality-bad")
-    with tab_recs:
-        _render_section_html(result.get("recommendations", ""), "quality-warn")
-    with tab_eval:
-        _render_section_html(result.get("evaluation", ""), eval_class)
-
-    # ---- combined report ----
-    divider()
-    st.markdown("### Full Agent Report")
-    st.caption("Combined output from all agents in the pipeline.")
-
     _SECTIONS = [
         ("Dataset Overview", result.get("overview", ""), "quality-neutral"),
         ("Anomaly Analysis", result.get("analysis", ""), "quality-bad"),
         ("Cleaning Recommendations", result.get("recommendations", ""), "quality-warn"),
         ("Quality Assessment", result.get("evaluation", ""), eval_class),
     ]
+    # Each body is converted once and shared by its tab and the full report.
+    section_html = [markdown_to_html(body) if body else "" for _, body, _ in _SECTIONS]
 
-    full_report_md = ""
-    full_report_html = ""
-    for title, body, cls in _SECTIONS:
-        full_report_md += f"## {title}\n\n{body}\n\n---\n\n"
-        full_report_html += f'<div class="{cls}"><h2>{title}</h2>{markdown_to_html(body)}</div><hr>'
+    for tab, html, (_, _, cls) in zip(
+        (tab_overview, tab_analysis, tab_recs, tab_eval), section_html, _SECTIONS
+    ):
+        with tab:
+            _render_section_html(html, cls)
+
+    # ---- combined report ----
+    divider()
+    st.markdown("### Full Agent Report")
+    st.caption("Combined output from all agents in the pipeline.")
+
+    def _full_report_md() -> str:
+        return "".join(f"## {title}\n\n{body}\n\n---\n\n" for title, body, _ in _SECTIONS)
+
+    full_report_html = "".join(
+        f'<div class="{cls}"><h2>{title}</h2>{html}</div><hr>'
+        for (title, _, cls), html in zip(_SECTIONS, section_html)
+    )
 
     st.markdown(
         f'<div class="agent-response">{full_report_html}</div>',
@@ -111,14 +117,17 @@ def render_results(
     stem = Path(uploaded_file_name).stem
     col_dl1, col_dl2 = st.columns(2)
     with col_dl1:
-        st.download_button(
-            "Download Report (.md)",
+        report_kwargs = dict(
             icon=":material/download:",
-            data=full_report_md,
             file_name=f"cleaning_report_{stem}.md",
             mime="text/markdown",
             use_container_width=True,
         )
+        try:
+            # Built only when the button is clicked.
+            st.download_button("Download Report (.md)", data=_full_report_md, **report_kwargs)
+        except StreamlitAPIException:  # Streamlit without callable ``data``
+            st.download_button("Download Report (.md)", data=_full_report_md(), **report_kwargs)
     with col_dl2:
         st.download_button(
             "Download Recommendations (.txt)",
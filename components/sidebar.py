@@ -5,6 +5,7 @@ Extracted from app.py to reduce main-page complexity.
 """
 from __future__ import annotations
 
+import shutil
 import tempfile
 from pathlib import Path
 from typing import Dict
@@ -12,7 +13,9 @@ from typing import Dict
 import pandas as pd
 import streamlit as st
 
+from components.readers.upload_utils import upload_key
 from components.ui_helpers import divider
+from utils.data_reader import read_delimited
 
 
 # ---------------------------------------------------------------------------
@@ -31,40 +34,115 @@ SUPPORTED_EXTENSIONS = {
 # ---------------------------------------------------------------------------
 # File I/O helpers
 # ---------------------------------------------------------------------------
+_COPY_BUFFER_SIZE = 8 << 20
+
+
+def _read_json(file) -> pd.DataFrame:
+    """Parse JSON with ``orjson`` when installed, else pandas' own reader."""
+    try:
+        import orjson
+    except ImportError:
+        return pd.read_json(file)
+    if isinstance(file, str):
+        return pd.DataFrame(orjson.loads(Path(file).read_bytes()))
+    file.seek(0)
+    return pd.DataFrame(orjson.loads(file.read()))
+
+
 def read_upload(file) -> pd.DataFrame:
-    """Read an uploaded file into a DataFrame, handling many formats."""
-    suffix = Path(file.name).suffix.lower().lstrip(".")
+    """Read an uploaded file (or a path to its persisted copy) into a DataFrame."""
+    name = file if isinstance(file, str) else file.name
+    suffix = Path(name).suffix.lower().lstrip(".")
     if suffix == "csv":
-        try:
-            return pd.read_csv(file)
-        except UnicodeDecodeError:
-            file.seek(0)
-            return pd.read_csv(file, encoding="latin-1")
+        return read_delimited(file, ",")
     elif suffix == "tsv":
-        try:
-            return pd.read_csv(file, sep="\t")
-        except UnicodeDecodeError:
-            file.seek(0)
-            return pd.read_csv(file, sep="\t", encoding="latin-1")
+        return read_delimited(file, "\t")
     elif suffix in ("xlsx", "xls"):
         return pd.read_excel(file)
     elif suffix == "parquet":
-        return pd.read_parquet(file)
+        import pyarrow.parquet as pq
+
+        return pq.ParquetFile(file, memory_map=isinstance(file, str)).read(use_threads=True).to_pandas(self_destruct=True)
     elif suffix == "json":
-        return pd.read_json(file)
+        return _read_json(file)
     else:
         raise ValueError(f"Unsupported file type: .{suffix}")
 
 
-def save_temp(file) -> str:
-    """Persist the upload to a temp file so the pipeline can access it by path."""
-    suffix = Path(file.name).suffix
-    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
-    tmp.write(file.getvalue())
-    tmp.close()
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _persist_temp(_file, key: str, name: str) -> str:
+    suffix = Path(name).suffix
+    _file.seek(0)
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        shutil.copyfileobj(_file, tmp, length=_COPY_BUFFER_SIZE)
+    _file.seek(0)
     return tmp.name
 
 
+def persist_frame(df: pd.DataFrame) -> str:
+    """Write *df* to an uncompressed Arrow IPC (Feather) file and return its path.
+
+    Only the path is kept in session state; ``load_frame`` memory-maps the file
+    so reruns share the OS page cache instead of each session holding a copy.
+    Frames Arrow cannot represent (e.g. mixed-type object columns) are pickled.
+    """
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    try:
+        table = pa.Table.from_pandas(df)
+    except (pa.ArrowException, TypeError, ValueError):
+        table = None
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".arrow" if table is not None else ".pkl") as tmp:
+        path = tmp.name
+    try:
+        if table is None:
+            df.to_pickle(path)
+        else:
+            # Uncompressed so the memory map can back columns without decompression.
+            feather.write_feather(table, path, compression="uncompressed")
+    except BaseException:
+        _discard_frame(path)
+        raise
+    return path
+
+
+def _discard_frame(path: str | None) -> None:
+    """Remove a frame file written by ``persist_frame`` once it is replaced."""
+    if not path:
+        return
+    try:
+        Path(path).unlink(missing_ok=True)
+    except OSError:  # still memory-mapped on Windows; the temp dir reclaims it
+        pass
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def load_frame(path: str) -> pd.DataFrame:
+    """Open a frame written by ``persist_frame`` (memory-mapped when Arrow)."""
+    if path.endswith(".pkl"):
+        return pd.read_pickle(path)
+
+    import pyarrow.feather as feather
+
+    table = feather.read_table(path, memory_map=True)
+    # split_blocks lets null-free numeric columns stay views over the map.
+    return table.to_pandas(split_blocks=True)
+
+
+def save_temp(file) -> str:
+    """Persist the upload to a temp file so the pipeline can access it by path.
+
+    The upload is streamed in fixed-size chunks rather than materialised with
+    ``getvalue()``, and the path is cached per upload (``upload_key``) so
+    reruns do not write the file again. The cache is process-wide, so it is
+    never keyed on the name or size alone: another session's file of the
+    same name and size must not resolve to this path.
+    """
+    return _persist_temp(file, upload_key(file), file.name)
+
+
 # ---------------------------------------------------------------------------
 # Sidebar renderer
 # ---------------------------------------------------------------------------
@@ -93,16 +171,22 @@ def render_sidebar() -> bool:
             st.session_state.uploaded_file is None
             or st.session_state.uploaded_file.name != uploaded.name
             or st.session_state.uploaded_file.size != uploaded.size
+            or upload_key(st.session_state.uploaded_file) != upload_key(uploaded)
         ):
             st.session_state.uploaded_file = uploaded
+            # The previous upload's frame file is no longer reachable.
+            _discard_frame(st.session_state.df_path)
+            st.session_state.df_path = None
             st.session_state.result = None
             st.session_state.status = "idle"
             st.session_state.error_msg = ""
             try:
-                st.session_state.df = read_upload(uploaded)
+                # Stream the upload to disk once, then parse from that path so
+                # the readers work on the file instead of the in-memory buffer.
                 st.session_state.file_path = save_temp(uploaded)
+                st.session_state.df_path = persist_frame(read_upload(st.session_state.file_path))
             except Exception as exc:
-                st.session_state.df = None
+                st.session_state.df_path = None
                 st.session_state.file_path = None
                 st.session_state.status = "error"
                 st.session_state.error_msg = str(exc)
@@ -116,6 +200,12 @@ def render_sidebar() -> bool:
             value=False,
             help="Display the retrieval-augmented context used by agents",
         )
+        st.toggle(
+            "Fast preview",
+            value=True,
+            key="fast_preview",
+            help="Compute preview statistics on a sample for very large datasets",
+        )
 
         divider()
 
@@ -1,13 +1,12 @@
 """
 Shared CSS styles for the Streamlit application.
 """
+import re
+
 import streamlit as st
 
 
-def inject_custom_css():
-    """Inject the application-wide custom CSS."""
-    st.markdown(
-        """
+_CSS_SOURCE = """
         <style>
         /* ---- global tweaks ---- */
         .block-container { padding-top: 2rem; padding-bottom: 2rem; }
@@ -141,6 +140,29 @@ def inject_custom_css():
             padding: 0.5rem 1.25rem;
         }
         </style>
-        """,
-        unsafe_allow_html=True,
-    )
+"""
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and collapse whitespace so each rerun sends fewer bytes."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{}:;,>])\s*", r"\1", css).strip()
+
+
+# Streamlit drops elements that are not re-emitted on a rerun, so the style
+# block must be sent every time; minifying it once keeps that payload small.
+_CSS = _minify_css(_CSS_SOURCE)
+
+
+def inject_custom_css():
+    """Inject the application-wide custom CSS.
+
+    ``st.html`` (Streamlit >= 1.33) sends the style block as raw HTML, skipping
+    the markdown pipeline; older versions fall back to ``st.markdown``.
+    """
+    html = getattr(st, "html", None)
+    if html is not None:
+        html(_CSS)
+    else:
+        st.markdown(_CSS, unsafe_allow_html=True)
@@ -3,8 +3,16 @@ Small UI helper utilities shared across pages.
 """
 from __future__ import annotations
 
+import threading
+from functools import lru_cache
+
 import streamlit as st
 
+try:
+    import markdown as _md
+except ImportError:  # optional: plain escaping is used instead
+    _md = None
+
 
 # ---------------------------------------------------------------------------
 # Status badge
@@ -26,31 +34,41 @@ def status_badge(status: str) -> str:
 # ---------------------------------------------------------------------------
 # HTML / Markdown helpers
 # ---------------------------------------------------------------------------
+_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", "\n": "<br>"})
+
+
 def escape_html(text: str) -> str:
     """Minimal HTML-escaping for rendering plain text in an HTML container."""
-    return (
-        text.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace("\n", "<br>")
-    )
+    return text.translate(_ESCAPE_TABLE)
+
+
+_MD_EXTENSIONS = ["fenced_code", "tables", "nl2br"]
+
+# ``markdown.Markdown`` instances are stateful, and Streamlit runs sessions on
+# separate threads, so each thread builds its converter once and reuses it.
+_md_local = threading.local()
+
+
+def _get_converter():
+    converter = getattr(_md_local, "converter", None)
+    if converter is None:
+        converter = _md.Markdown(extensions=_MD_EXTENSIONS)
+        _md_local.converter = converter
+    return converter
 
 
+@lru_cache(maxsize=512)
 def markdown_to_html(markdown_text: str) -> str:
     """Convert Markdown to basic HTML.
 
     Uses the ``markdown`` library if available, otherwise falls back to
-    simple escaping.
+    simple escaping.  Results (either path) are memoised process-wide, so
+    the same agent output is parsed once across tabs, the combined report,
+    reruns and sessions.
     """
-    try:
-        import markdown as _md
-
-        return _md.markdown(
-            markdown_text,
-            extensions=["fenced_code", "tables", "nl2br"],
-        )
-    except ImportError:
+    if _md is None:
         return escape_html(markdown_text)
+    return _get_converter().reset().convert(markdown_text)
 
 
 # ---------------------------------------------------------------------------
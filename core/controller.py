@@ -1,17 +1,37 @@
+import asyncio
 import os
+from functools import lru_cache, partial
 
 from agents.analyzer import analyze_dataset
 from agents.rewriter import recommend_cleaning_strategies
 from agents.evaluator import evaluate_data_quality
-from utils.data_reader import read_dataset, get_dataset_info
+from utils.data_reader import read_dataset, get_dataset_info, get_column_group_infos
 from utils.rag import retrieve_strategy_context
 
-def clean_dataset(file_path: str):
-    """Main pipeline for analyzing dataset and recommending cleaning strategies."""
+@lru_cache(maxsize=4)
+def _profile_dataset(file_path: str, mtime_ns: int, size: int):
+    """Read and profile *file_path* once per on-disk version of the file.
     
-    # Step 1: Read the dataset
+    ``mtime_ns`` and ``size`` only key the cache, so a "Re-run Analysis" on an
+    unchanged upload skips parsing and profiling. The profile is read-only.
+    """
     df = read_dataset(file_path)
     dataset_info = get_dataset_info(df, file_path)
+    column_groups = get_column_group_infos(df, dataset_info)
+    return dataset_info, column_groups
+
+
+def clean_dataset(file_path: str, on_chunk=None):
+    """Main pipeline for analyzing dataset and recommending cleaning strategies.
+    
+    If given, ``on_chunk(section, text)`` is called with each piece of agent
+    output as it streams in; ``section`` is ``"analysis"``,
+    ``"recommendations"`` or ``"evaluation"``.
+    """
+    
+    # Step 1: Read the dataset
+    stat = os.stat(file_path)
+    dataset_info, column_groups = _profile_dataset(file_path, stat.st_mtime_ns, stat.st_size)
     
     # Step 2: Retrieve similar cleaning strategies from past analyses (RAG)
     query = f"Dataset with {dataset_info['rows']} rows, {dataset_info['columns']} columns. Missing values: {dataset_info['missing_values']}. Duplicates: {dataset_info['duplicates']}."
@@ -22,31 +42,54 @@ def clean_dataset(file_path: str):
         print("\n[RAG] strategy_context preview:\n")
         print(strategy_context[:800])
     
+    # Steps 3-5: Run the agents (independent calls overlap, dependent ones chain)
+    overview, analysis, recommendations, evaluation = asyncio.run(
+        _run_agents(dataset_info, strategy_context, column_groups, on_chunk)
+    )
+    
+    return {
+        "overview": overview,
+        "analysis": analysis,
+        "recommendations": recommendations,
+        "evaluation": evaluation,
+        "strategy_context": strategy_context,
+    }
+
+
+async def _run_agents(dataset_info: dict, strategy_context: str, column_groups: list, on_chunk=None):
+    """Run the agents in dependency order, streaming each section through *on_chunk*."""
+    
+    def _sink(section: str):
+        return partial(on_chunk, section) if on_chunk is not None else None
+    
+    overview = format_dataset_overview(dataset_info)
+    
     # Step 3: Analyze dataset for anomalies
-    analysis = analyze_dataset(dataset_info, strategy_context=strategy_context)
+    analysis = await analyze_dataset(
+        dataset_info,
+        strategy_context=strategy_context,
+        column_groups=column_groups,
+        on_chunk=_sink("analysis"),
+    )
     
-    # Step 4: Generate cleaning recommendations
-    recommendations = recommend_cleaning_strategies(
+    # Step 4: Generate cleaning recommendations (needs the analysis)
+    recommendations = await recommend_cleaning_strategies(
         dataset_info, 
         analysis, 
-        strategy_context=strategy_context
+        strategy_context=strategy_context,
+        on_chunk=_sink("recommendations"),
     )
     
-    # Step 5: Evaluate data quality and strategies
-    evaluation = evaluate_data_quality(
+    # Step 5: Evaluate data quality and strategies (needs both of the above)
+    evaluation = await evaluate_data_quality(
         dataset_info,
         analysis,
         recommendations,
-        strategy_context=strategy_context
+        strategy_context=strategy_context,
+        on_chunk=_sink("evaluation"),
     )
     
-    return {
-        "overview": format_dataset_overview(dataset_info),
-        "analysis": analysis,
-        "recommendations": recommendations,
-        "evaluation": evaluation,
-        "strategy_context": strategy_context,
-    }
+    return overview, analysis, recommendations, evaluation
 
 
 def format_dataset_overview(info: dict) -> str:
@@ -3,17 +3,27 @@ Dataset Reader Page
 Provides UI for reading various dataset types including tabular, image, audio,
 and large datasets.
 """
+from importlib import import_module
+
 import streamlit as st
 from components.icon_utils import load_fontawesome, icon
 from components.styles import inject_custom_css
-from components.readers import (
-    render_tabular_reader,
-    render_image_classification_reader,
-    render_image_detection_reader,
-    render_image_segmentation_reader,
-    render_audio_reader,
-    render_large_dataset_reader,
-)
+
+# Dataset type label -> "module:function"; only the chosen reader is imported.
+_READERS = {
+    "Tabular / ML (CSV, TSV, XLSX, JSON, Parquet, TXT)":
+        "components.readers.tabular:render_tabular_reader",
+    "Image Classification (JPG, PNG, ZIP folder)":
+        "components.readers.image_classification:render_image_classification_reader",
+    "Image Detection (Images + Annotations)":
+        "components.readers.image_detection:render_image_detection_reader",
+    "Image Segmentation (Images + Masks + JSON)":
+        "components.readers.image_segmentation:render_image_segmentation_reader",
+    "Audio / Speech (WAV, MP3 + Labels)":
+        "components.readers.audio:render_audio_reader",
+    "Large Datasets (HDF5, Pickle, ZIP/TAR)":
+        "components.readers.large_datasets:render_large_dataset_reader",
+}
 
 # ---------------------------------------------------------------------------
 # Page configuration
@@ -36,37 +46,12 @@ st.markdown(f'<h1>{icon("folder", "icon-title")} Dataset Reader</h1>', unsafe_al
 # ---------------------------------------------------------------------------
 # Dataset type selection
 # ---------------------------------------------------------------------------
-dataset_type = st.selectbox(
-    "Select Dataset Type",
-    [
-        "Tabular / ML (CSV, TSV, XLSX, JSON, Parquet, TXT)",
-        "Image Classification (JPG, PNG, ZIP folder)",
-        "Image Detection (Images + Annotations)",
-        "Image Segmentation (Images + Masks + JSON)",
-        "Audio / Speech (WAV, MP3 + Labels)",
-        "Large Datasets (HDF5, Pickle, ZIP/TAR)",
-    ],
-)
+dataset_type = st.selectbox("Select Dataset Type", list(_READERS))
 
 st.divider()
 
 # ---------------------------------------------------------------------------
 # Route to appropriate reader
 # ---------------------------------------------------------------------------
-if dataset_type.startswith("Tabular"):
-    render_tabular_reader()
-
-elif dataset_type.startswith("Image Classification"):
-    render_image_classification_reader()
-
-elif dataset_type.startswith("Image Detection"):
-    render_image_detection_reader()
-
-elif dataset_type.startswith("Image Segmentation"):
-    render_image_segmentation_reader()
-
-elif dataset_type.startswith("Audio"):
-    render_audio_reader()
-
-elif dataset_type.startswith("Large Datasets"):
-    render_large_dataset_reader()
+module_name, func_name = _READERS[dataset_type].split(":")
+getattr(import_module(module_name), func_name)()
@@ -2,12 +2,14 @@
 Dataset Splitter Page
 Split a folder-structured image dataset into train / validation / test sets.
 """
+import os
+
 import streamlit as st
 from pathlib import Path
 
 from components.icon_utils import load_fontawesome, icon
 from components.styles import inject_custom_css
-from utils.splitter import split_dataset
+from utils.splitter import MODES, split_dataset
 
 # ---------------------------------------------------------------------------
 # Page configuration
@@ -63,8 +65,39 @@ test_ratio = round(1.0 - train_ratio - val_ratio, 2)
 with r3:
     st.metric("Test %", f"{test_ratio:.0%}")
 
+mode = st.radio(
+    "File placement",
+    MODES,
+    format_func={"link": "Hard link", "reflink": "Reflink (copy-on-write)", "copy": "Copy"}.get,
+    horizontal=True,
+    help=(
+        "Hard links are instant and use no extra space, but share edits with the "
+        "originals. Reflinks are instant copies on btrfs/XFS. Both fall back to a "
+        "copy when the output is on another filesystem."
+    ),
+)
+
 st.divider()
 
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+def _split_summary(split_dir: Path):
+    """Return ``(n_classes, n_files)`` for *split_dir* using one listing per folder.
+
+    ``os.scandir`` entries carry the dirent type, so no per-file ``stat`` is made.
+    """
+    n_classes = n_files = 0
+    with os.scandir(split_dir) as classes:
+        for class_entry in classes:
+            if not class_entry.is_dir():
+                continue
+            n_classes += 1
+            with os.scandir(class_entry.path) as files:
+                n_files += sum(1 for entry in files if entry.is_file())
+    return n_classes, n_files
+
+
 # ---------------------------------------------------------------------------
 # Run
 # ---------------------------------------------------------------------------
@@ -75,7 +108,7 @@ if st.button("Split Dataset", icon=":material/rocket_launch:", type="primary"):
         st.error("Input path does not exist.")
     else:
         with st.spinner("Splitting dataset …"):
-            split_dataset(input_dir, output_dir, train_ratio, val_ratio, test_ratio)
+            split_dataset(input_dir, output_dir, train_ratio, val_ratio, test_ratio, mode=mode)
         st.success("Dataset split successfully!", icon=":material/check_circle:")
 
         # Show output summary
@@ -84,6 +117,5 @@ if st.button("Split Dataset", icon=":material/rocket_launch:", type="primary"):
             for split_name in ["train", "val", "test"]:
                 split_dir = out_path / split_name
                 if split_dir.exists():
-                    classes = [d.name for d in split_dir.iterdir() if d.is_dir()]
-                    total = sum(len(list((split_dir / c).glob("*"))) for c in classes)
-                    st.write(f"**{split_name.capitalize()}**: {len(classes)} classes, {total} files")
+                    n_classes, total = _split_summary(split_dir)
+                    st.write(f"**{split_name.capitalize()}**: {n_classes} classes, {total} files")
@@ -0,0 +1,62 @@
+"""Checks for the dataset splitter's file placement modes."""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.splitter import MODES, split_dataset
+
+
+def _make_dataset(root: Path) -> dict:
+    contents = {}
+    for cls in ("cats", "dogs"):
+        (root / cls).mkdir(parents=True)
+        for i in range(10):
+            path = root / cls / f"{i}.jpg"
+            path.write_bytes(os.urandom(256))
+            contents[path] = path.read_bytes()
+    return contents
+
+
+def test_resplit_keeps_sources():
+    """A link split followed by reflink/copy splits into the same output
+    must leave the source images intact and the outputs as full copies."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        contents = _make_dataset(root / "in")
+        out = root / "out"
+
+        for mode in ("link", "reflink", "copy", "link"):
+            split_dataset(root / "in", out, mode=mode)
+
+            for path, data in contents.items():
+                assert path.read_bytes() == data, f"{mode}: source {path} changed"
+
+            outputs = [p for p in out.rglob("*") if p.is_file()]
+            assert len(outputs) == len(contents)
+            assert not any(p.name.startswith(".") for p in outputs)
+            for p in outputs:
+                assert p.read_bytes() == contents[root / "in" / p.parent.name / p.name]
+                if mode != "link":
+                    assert not os.path.samefile(p, root / "in" / p.parent.name / p.name)
+
+
+def test_modes_are_deterministic():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _make_dataset(root / "in")
+        listings = []
+        for mode in MODES:
+            split_dataset(root / "in", root / mode, seed=7, mode=mode)
+            listings.append(sorted(str(p.relative_to(root / mode)) for p in (root / mode).rglob("*.jpg")))
+        assert listings[0] == listings[1] == listings[2]
+
+
+if __name__ == "__main__":
+    test_resplit_keeps_sources()
+    test_modes_are_deterministic()
+    print("✓ All splitter tests passed!")
@@ -1,8 +1,216 @@
 """Utility module for reading and analyzing datasets."""
 
+import sys
+
 import pandas as pd
+from pandas.util import hash_pandas_object
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List
+
+# Only the columns with the most missing values are described in prompts.
+_STATS_MAX_COLUMNS = 20
+
+# Wider frames are profiled (and analyzed) in column groups of this size.
+_COLUMN_GROUP_SIZE = 40
+
+_ARROW_BLOCK_SIZE = 8 << 20
+
+# Object columns are sized from this many sampled values per column.
+_MEM_SAMPLE_ROWS = 1_000
+
+
+def _short_cell(value) -> str:
+    """Render a statistics cell compactly (floats to 4 significant digits)."""
+    if isinstance(value, float):
+        return f"{value:.4g}" if value == value else ""
+    return str(value)
+
+
+def estimate_memory_mb(df: pd.DataFrame) -> float:
+    """Estimate memory use without ``deep=True`` walking every Python object.
+
+    Buffers are counted exactly; object columns add the mean ``getsizeof`` of
+    up to ``_MEM_SAMPLE_ROWS`` sampled values, scaled to the full length.
+    """
+    total = float(df.memory_usage(index=True, deep=False).sum())
+    n = len(df)
+    if n:
+        take = min(_MEM_SAMPLE_ROWS, n)
+        # Only true object columns hold per-row Python objects; Arrow-backed
+        # strings are already sized exactly by the shallow pass.
+        for pos, dtype in enumerate(df.dtypes):
+            if dtype != object:
+                continue
+            sample = df.iloc[:, pos].sample(n=take, random_state=0)
+            total += float(sample.map(sys.getsizeof).mean()) * n
+    return total / 1024 / 1024
+
+
+def count_duplicate_rows(df: pd.DataFrame) -> int:
+    """
+    Count duplicate rows by de-duplicating one uint64 hash per row.
+    
+    Rows are hashed column-wise in vectorized C code, instead of
+    ``df.duplicated()`` factorizing every column and combining the codes.
+    """
+    if df.shape[1] == 0:
+        return 0
+    try:
+        row_hashes = hash_pandas_object(df, index=False, categorize=False)
+    except (TypeError, ValueError):
+        # Unhashable cells (lists, dicts) in some object column: hash those
+        # columns by their string form and de-duplicate the per-column hashes.
+        col_hashes = {}
+        for pos in range(df.shape[1]):
+            col = df.iloc[:, pos]
+            try:
+                col_hashes[pos] = hash_pandas_object(col, index=False, categorize=False).to_numpy()
+            except (TypeError, ValueError):
+                col_hashes[pos] = hash_pandas_object(col.astype(str), index=False).to_numpy()
+        return int(pd.DataFrame(col_hashes).duplicated().sum())
+    return int(row_hashes.duplicated().sum())
+
+
+def _rewind(source) -> None:
+    """Seek file objects back to the start; paths need nothing."""
+    if hasattr(source, 'seek'):
+        source.seek(0)
+
+
+def _read_delimited_pandas(source, sep: str, **kwargs) -> pd.DataFrame:
+    """pandas' C parser, retried as Latin-1 when the file is not UTF-8."""
+    _rewind(source)
+    try:
+        return pd.read_csv(source, sep=sep, **kwargs)
+    except UnicodeDecodeError:
+        _rewind(source)
+        return pd.read_csv(source, sep=sep, encoding='latin-1', **kwargs)
+
+
+def read_delimited(source, sep: str) -> pd.DataFrame:
+    """
+    Parse delimited text with PyArrow's multithreaded reader.
+    
+    The result matches ``pd.read_csv``: input Arrow rejects (ragged rows,
+    quoted newlines across block boundaries, multi-character separators) and
+    non-UTF-8 files, which Arrow reads as ``binary`` columns, go to pandas,
+    and duplicate or empty header names get pandas' ``a.1`` / ``Unnamed: 2``
+    names.
+    
+    Args:
+        source: Path or binary file object
+        sep: Field delimiter
+    """
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pacsv
+    except ImportError:
+        return _read_delimited_pandas(source, sep)
+    if len(sep) != 1:
+        return _read_delimited_pandas(source, sep)
+    if isinstance(source, Path):
+        source = str(source)
+
+    read_options = pacsv.ReadOptions(use_threads=True, block_size=_ARROW_BLOCK_SIZE)
+    parse_options = pacsv.ParseOptions(delimiter=sep)
+
+    def _convert_options(column_types=None):
+        # Empty and "NA"-style cells become nulls in text columns too, as in pandas.
+        return pacsv.ConvertOptions(column_types=column_types, strings_can_be_null=True)
+
+    def _as_text(schema):
+        # Arrow infers dates and times; pandas keeps them as text.
+        return {f.name: pa.string() for f in schema if pa.types.is_temporal(f.type)}
+
+    try:
+        # Type the first block only to find date/time columns, so the whole
+        # file is parsed once, with those columns kept as strings.
+        _rewind(source)
+        with pacsv.open_csv(
+            source,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=_convert_options(),
+        ) as reader:
+            text_types = _as_text(reader.schema)
+        _rewind(source)
+        table = pacsv.read_csv(
+            source,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=_convert_options(text_types),
+        )
+        # A column with no values in the first block is typed from the whole
+        # file, and can still come back temporal.
+        late = _as_text(table.schema)
+        if late:
+            _rewind(source)
+            table = pacsv.read_csv(
+                source,
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=_convert_options({**text_types, **late}),
+            )
+    except pa.ArrowInvalid:
+        return _read_delimited_pandas(source, sep)
+    if any(pa.types.is_binary(field.type) for field in table.schema):
+        return _read_delimited_pandas(source, sep)
+    names = table.column_names
+    if '' in names or len(set(names)) != len(names):
+        # Take pandas' de-duplicated names from the header row alone.
+        header = _read_delimited_pandas(source, sep, nrows=0)
+        table = table.rename_columns([str(c) for c in header.columns])
+    return table.to_pandas(self_destruct=True)
+
+
+def read_excel(source, sheet_name=0) -> pd.DataFrame:
+    """Read one sheet (the first by default), with the Rust ``calamine`` engine when installed.
+    
+    Falls back to pandas' default openpyxl/xlrd engines otherwise.
+    """
+    try:
+        import python_calamine
+    except ImportError:
+        return pd.read_excel(source, sheet_name=sheet_name)
+    try:
+        return pd.read_excel(source, sheet_name=sheet_name, engine='calamine')
+    except ValueError:  # pandas < 2.2 has no calamine engine
+        return pd.read_excel(source, sheet_name=sheet_name)
+
+
+def _read_parquet(file_path: Path) -> pd.DataFrame:
+    """Read Parquet memory-mapped and multithreaded when pyarrow is available."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        return pd.read_parquet(file_path)
+    table = pq.read_table(str(file_path), memory_map=True, use_threads=True)
+    return table.to_pandas(self_destruct=True)
+
+
+def _read_json(file_path: Path) -> pd.DataFrame:
+    """
+    Parse JSON with ``orjson`` (as the upload preview does) when installed.
+    
+    Line-delimited files, which are not one JSON document, go to PyArrow's
+    multithreaded JSON reader, or to ``pd.read_json(lines=True)``.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return pd.read_json(file_path)
+    try:
+        return pd.DataFrame(orjson.loads(file_path.read_bytes()))
+    except orjson.JSONDecodeError:
+        pass
+    try:
+        from pyarrow import json as pajson
+    except ImportError:
+        return pd.read_json(file_path, lines=True)
+    table = pajson.read_json(
+        str(file_path), read_options=pajson.ReadOptions(block_size=_ARROW_BLOCK_SIZE)
+    )
+    return table.to_pandas(self_destruct=True)
 
 
 def read_dataset(file_path: str) -> pd.DataFrame:
@@ -19,78 +227,57 @@ def read_dataset(file_path: str) -> pd.DataFrame:
     suffix = file_path.suffix.lower()
 
     if suffix == '.csv':
-        # Try different encodings for CSV
-        try:
-            df = pd.read_csv(file_path)
-        except UnicodeDecodeError:
-            df = pd.read_csv(file_path, encoding='latin-1')
+        df = read_delimited(file_path, ',')
     elif suffix == '.tsv':
-        try:
-            df = pd.read_csv(file_path, sep='\t')
-        except UnicodeDecodeError:
-            df = pd.read_csv(file_path, sep='\t', encoding='latin-1')
+        df = read_delimited(file_path, '\t')
     elif suffix in ['.xlsx', '.xls']:
-        df = pd.read_excel(file_path)
+        df = read_excel(file_path)
     elif suffix == '.parquet':
-        df = pd.read_parquet(file_path)
+        df = _read_parquet(file_path)
     elif suffix == '.json':
-        df = pd.read_json(file_path)
+        df = _read_json(file_path)
     else:
         raise ValueError(f"Unsupported file format: {file_path.suffix}")
     
     return df
 
 
-def get_dataset_info(df: pd.DataFrame, file_path: str) -> Dict:
+def _column_info(df: pd.DataFrame, missing: pd.Series) -> Dict:
     """
-    Extract comprehensive information about the dataset.
+    Per-column part of a dataset profile (no row-level statistics).
     
     Args:
-        df: pandas DataFrame
-        file_path: Original file path
+        df: pandas DataFrame (the whole frame or a column group)
+        missing: Null count per column of *df*, in column order
         
     Returns:
-        Dictionary containing dataset information
+        Dictionary with the column-level fields of ``get_dataset_info``
     """
-    # Basic info
     info = {
-        'file_name': Path(file_path).name,
-        'rows': len(df),
         'columns': len(df.columns),
         'column_names': list(df.columns),
     }
     
     # Data types
-    dtypes_str = "\n".join([f"  {col}: {dtype}" for col, dtype in df.dtypes.items()])
-    info['dtypes'] = dtypes_str
+    info['dtypes'] = "\n".join([f"  {col}: {dtype}" for col, dtype in df.dtypes.items()])
     
     # Missing values
-    missing = df.isnull().sum()
-    missing_pct = (missing / len(df) * 100).round(2)
-    missing_info = []
-    for col in df.columns:
-        if missing[col] > 0:
-            missing_info.append(f"  {col}: {missing[col]} ({missing_pct[col]}%)")
-    
-    if missing_info:
-        info['missing_values'] = "\n".join(missing_info)
-    else:
-        info['missing_values'] = "  None"
-    
-    # Duplicates
-    info['duplicates'] = df.duplicated().sum()
-    
-    # Memory usage
-    memory_mb = df.memory_usage(deep=True).sum() / 1024 / 1024
-    info['memory_usage'] = f"{memory_mb:.2f} MB"
+    nonzero = missing[missing > 0]
+    nonzero_pct = (nonzero / len(df) * 100).round(2)
+    info['missing_values'] = "\n".join(
+        f"  {col}: {count} ({pct}%)"
+        for col, count, pct in zip(nonzero.index, nonzero.tolist(), nonzero_pct.tolist())
+    ) or "  None"
     
-    # Sample data (first 5 rows)
-    info['head'] = df.head(5).to_string()
+    # Sample data (first 5 rows) as TSV — far fewer tokens than the repr
+    info['head'] = df.head(5).to_csv(sep='\t', index=False)
     
-    # Basic statistics
+    # Basic statistics, limited to the columns with the most missing values
     try:
-        stats = df.describe(include='all').to_string()
-        info['statistics'] = stats
+        top_cols = missing.sort_values(ascending=False, kind='stable').index[:_STATS_MAX_COLUMNS]
+        stats = df[top_cols].describe(include='all').T
+        stats = stats.apply(lambda col: col.map(_short_cell))
+        info['statistics'] = stats.to_csv(sep='\t')
     except Exception:
         info['statistics'] = "Unable to generate statistics"
     
@@ -100,3 +287,105 @@ def get_dataset_info(df: pd.DataFrame, file_path: str) -> Dict:
     info['datetime_columns'] = list(df.select_dtypes(include=['datetime64']).columns)
     
     return info
+
+
+def get_dataset_info(df: pd.DataFrame, file_path: str) -> Dict:
+    """
+    Extract comprehensive information about the dataset.
+    
+    Args:
+        df: pandas DataFrame
+        file_path: Original file path
+        
+    Returns:
+        Dictionary containing dataset information
+    """
+    # Basic info
+    info = {
+        'file_name': Path(file_path).name,
+        'rows': len(df),
+        # Null count per column, kept so column groups need not rescan the frame
+        'missing_counts': df.isnull().sum(),
+    }
+    info.update(_column_info(df, info['missing_counts']))
+    
+    # Duplicates
+    info['duplicates'] = count_duplicate_rows(df)
+    
+    # Memory usage
+    info['memory_usage'] = f"{estimate_memory_mb(df):.2f} MB"
+    
+    info['prompt_context'] = format_prompt_context(info)
+    
+    return info
+
+
+def get_column_group_infos(
+    df: pd.DataFrame,
+    info: Dict,
+    group_size: int = _COLUMN_GROUP_SIZE,
+) -> List[Dict]:
+    """
+    Profile a wide dataset in balanced column groups for batched analysis.
+    
+    Row-level facts (row count, duplicate rows, memory use) and the null
+    counts come from *info*; only per-column statistics are computed for
+    each group.
+    
+    Args:
+        df: pandas DataFrame
+        info: Whole-frame dictionary from ``get_dataset_info``
+        group_size: Maximum number of columns per group
+        
+    Returns:
+        One info dictionary per column group, or an empty list when the
+        frame is narrow enough to analyze in a single prompt
+    """
+    n_cols = len(df.columns)
+    if n_cols <= group_size:
+        return []
+    
+    n_groups = -(-n_cols // group_size)
+    bounds = [round(i * n_cols / n_groups) for i in range(n_groups + 1)]
+    missing = info['missing_counts']
+    
+    groups = []
+    for start, stop in zip(bounds, bounds[1:]):
+        group = {
+            'file_name': info['file_name'],
+            'rows': info['rows'],
+            'duplicates': info['duplicates'],
+            'memory_usage': info['memory_usage'],
+        }
+        group.update(_column_info(df.iloc[:, start:stop], missing.iloc[start:stop]))
+        group['column_group'] = f"columns {start + 1}-{stop} of {n_cols}"
+        group['prompt_context'] = (
+            f"Column Group: {group['column_group']}\n" + format_prompt_context(group)
+        )
+        groups.append(group)
+    return groups
+
+
+def format_prompt_context(info: Dict) -> str:
+    """
+    Serialize the dataset profile once into the compact block sent to the LLM.
+    
+    Args:
+        info: Dictionary returned by ``get_dataset_info``
+        
+    Returns:
+        Plain-text dataset description for prompt injection
+    """
+    return (
+        f"File: {info['file_name']}\n"
+        f"Rows: {info['rows']}\n"
+        f"Columns: {info['columns']}\n"
+        f"Column Names: {', '.join(map(str, info['column_names']))}\n"
+        f"Data Types:\n{info['dtypes']}\n"
+        f"Missing Values:\n{info['missing_values']}\n"
+        f"Duplicate Rows: {info['duplicates']}\n"
+        f"Memory Usage: {info['memory_usage']}\n"
+        f"\nSample Data (first 5 rows, TSV):\n{info['head']}"
+        f"\nBasic Statistics (TSV, up to {_STATS_MAX_COLUMNS} columns with most missing values):\n"
+        f"{info['statistics']}"
+    )
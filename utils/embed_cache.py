@@ -0,0 +1,96 @@
+"""
+On-disk cache of embedding vectors, keyed by a hash of model + chunk text.
+
+Re-indexing an unchanged corpus (or one with a few edited files) then only
+sends the new chunks to the embedding server.
+"""
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+# Stay well below SQLite's default limit on bound parameters per statement.
+_SELECT_BATCH = 500
+
+# Cache misses are sent as up to this many concurrent requests, each of at
+# least _MIN_REQUEST_TEXTS texts, so the embedding server's queue stays busy.
+_EMBED_CONCURRENCY = 8
+_MIN_REQUEST_TEXTS = 16
+
+
+def _text_key(model: str, text: str) -> bytes:
+    return hashlib.blake2b(f"{model}\0{text}".encode("utf-8"), digest_size=16).digest()
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path))
+    conn.execute("CREATE TABLE IF NOT EXISTS embeddings (hash BLOB PRIMARY KEY, vec BLOB NOT NULL)")
+    return conn
+
+
+def _lookup(conn: sqlite3.Connection, keys: Sequence[bytes]) -> Dict[bytes, bytes]:
+    found: Dict[bytes, bytes] = {}
+    for start in range(0, len(keys), _SELECT_BATCH):
+        part = keys[start:start + _SELECT_BATCH]
+        placeholders = ",".join("?" * len(part))
+        found.update(
+            conn.execute(
+                f"SELECT hash, vec FROM embeddings WHERE hash IN ({placeholders})", part
+            ).fetchall()
+        )
+    return found
+
+
+def _embed_concurrently(embeddings, texts: List[str], concurrency: int) -> List[List[float]]:
+    size = max(_MIN_REQUEST_TEXTS, -(-len(texts) // max(1, concurrency)))
+    parts = [texts[i:i + size] for i in range(0, len(texts), size)]
+    if len(parts) == 1:
+        return embeddings.embed_documents(texts)
+    # HTTP calls wait on the server with the GIL released.
+    with ThreadPoolExecutor(max_workers=len(parts)) as pool:
+        return [vec for part in pool.map(embeddings.embed_documents, parts) for vec in part]
+
+
+def embed_documents_cached(
+    embeddings,
+    texts: Sequence[str],
+    *,
+    model: str,
+    path: Path,
+    concurrency: int = _EMBED_CONCURRENCY,
+) -> List[List[float]]:
+    """``embeddings.embed_documents(texts)``, serving repeated texts from *path*.
+
+    Only cache misses are sent to the embedding server, split across up to
+    *concurrency* batched requests in flight at once.
+    Vectors are stored as float32, and hits and misses are returned at that
+    same precision so results do not depend on cache state.
+    """
+    keys = [_text_key(model, t) for t in texts]
+    conn = _connect(path)
+    try:
+        found = _lookup(conn, list(dict.fromkeys(keys)))
+
+        missing: Dict[bytes, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found:
+                missing.setdefault(key, text)
+        if missing:
+            vectors = _embed_concurrently(embeddings, list(missing.values()), concurrency)
+            rows = [
+                (key, np.asarray(vec, dtype=np.float32).tobytes())
+                for key, vec in zip(missing, vectors)
+            ]
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO embeddings (hash, vec) VALUES (?, ?)", rows)
+            found.update(rows)
+    finally:
+        conn.close()
+
+    return [np.frombuffer(found[key], dtype=np.float32).tolist() for key in keys]
@@ -0,0 +1,200 @@
+"""
+Flat inner-product vector store for the strategy corpus.
+
+The store is kept column-wise rather than as one object per chunk:
+
+* ``vecs.f16``    – L2-normalized vectors as raw float16, memory-mapped;
+* ``vecs.i8``     – the same vectors quantized to int8, with one float32
+  scale per vector in ``scales.npy``;
+* ``texts.bin``   – every chunk's UTF-8 text back to back, memory-mapped;
+* ``offsets.npy`` – ``count + 1`` byte offsets of each text in ``texts.bin``;
+* ``sources.txt`` – one source path per line.
+
+With faiss installed a query is an exact search over an fp16
+``IndexScalarQuantizer``. Without it, the int8 codes are scanned (with simsimd's
+int8 kernels when available), and the best candidates are re-scored from the
+float16 vectors. Chunk text is decoded only for the rows that are returned.
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import simsimd
+except ImportError:
+    simsimd = None
+
+_FORMAT = 3
+_VECTORS = "vecs.f16"
+_CODES = "vecs.i8"
+_SCALES = "scales.npy"
+_TEXTS = "texts.bin"
+_OFFSETS = "offsets.npy"
+_SOURCES = "sources.txt"
+_MANIFEST = "store.json"
+
+# Rows upcast to float32 at a time during a scan or an index build.
+_BLOCK_ROWS = 8192
+
+# Candidates from the int8 scan that are re-scored at float precision.
+_RERANK = 50
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+def _quantize(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Symmetric int8 codes with one scale per row: ``vectors ≈ codes * scales``."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    scales = np.abs(vectors).max(axis=-1, keepdims=True) / 127
+    scales[scales == 0] = 1
+    codes = np.clip(np.rint(vectors / scales), -127, 127).astype(np.int8)
+    return codes, scales[..., 0]
+
+
+def _int8_dot(codes: np.ndarray, query: np.ndarray) -> np.ndarray:
+    if simsimd is not None:
+        return np.asarray(simsimd.cdist(query[None, :], codes, metric="dot"))[0]
+    # Products of int8 codes are exact in float32 at typical embedding widths,
+    # and the float32 product keeps the BLAS path.
+    return np.asarray(codes, dtype=np.float32) @ query.astype(np.float32)
+
+
+def _memmap(path: Path, dtype, shape=None) -> np.ndarray:
+    # ``np.memmap`` rejects empty files.
+    if path.stat().st_size == 0:
+        return np.zeros(shape if shape is not None else 0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", shape=shape)
+
+
+class FlatIPStore:
+    """Exact cosine search over normalized float16 vectors."""
+
+    def __init__(
+        self,
+        vectors: np.ndarray,
+        codes: np.ndarray,
+        scales: np.ndarray,
+        texts: np.ndarray,
+        offsets: np.ndarray,
+        sources: List[str],
+    ) -> None:
+        self.vectors = vectors
+        self._codes = codes
+        self._scales = scales
+        self._texts = texts
+        self._offsets = offsets
+        self._sources = sources
+        self._index = None
+        try:
+            import faiss
+        except ImportError:
+            return
+        index = faiss.IndexScalarQuantizer(
+            vectors.shape[1], faiss.ScalarQuantizer.QT_fp16, faiss.METRIC_INNER_PRODUCT
+        )
+        for start in range(0, len(vectors), _BLOCK_ROWS):
+            index.add(np.asarray(vectors[start:start + _BLOCK_ROWS], dtype=np.float32))
+        self._index = index
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    @classmethod
+    def build(
+        cls,
+        directory: Path,
+        texts: Sequence[str],
+        sources: Sequence[str],
+        vectors: np.ndarray,
+        *,
+        model: str,
+    ) -> "FlatIPStore":
+        """Normalize and persist *vectors* with their chunks, then return the store."""
+        directory.mkdir(parents=True, exist_ok=True)
+        vecs = _normalize(vectors).astype(np.float16)
+        vecs.tofile(directory / _VECTORS)
+        codes, scales = _quantize(vecs)
+        codes.tofile(directory / _CODES)
+        np.save(directory / _SCALES, scales)
+
+        offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+        with (directory / _TEXTS).open("wb") as fh:
+            for i, text in enumerate(texts, start=1):
+                data = text.encode("utf-8")
+                fh.write(data)
+                offsets[i] = offsets[i - 1] + len(data)
+        np.save(directory / _OFFSETS, offsets)
+        (directory / _SOURCES).write_text(
+            "".join(f"{s}\n" for s in sources), encoding="utf-8"
+        )
+        (directory / _MANIFEST).write_text(
+            json.dumps({
+                "format": _FORMAT,
+                "model": model,
+                "count": len(texts),
+                "dim": int(vecs.shape[1]) if vecs.ndim == 2 else 0,
+            }),
+            encoding="utf-8",
+        )
+        return cls.load(directory, model=model)
+
+    @classmethod
+    def load(cls, directory: Path, *, model: str) -> Optional["FlatIPStore"]:
+        """The store saved in *directory*, or ``None`` if absent, stale or built with another model."""
+        try:
+            manifest = json.loads((directory / _MANIFEST).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if manifest.get("format") != _FORMAT or manifest.get("model") != model:
+            return None
+        count, dim = manifest["count"], manifest["dim"]
+        vectors = _memmap(directory / _VECTORS, np.float16, (count, dim))
+        codes = _memmap(directory / _CODES, np.int8, (count, dim))
+        scales = np.load(directory / _SCALES)
+        offsets = np.load(directory / _OFFSETS)
+        texts = _memmap(directory / _TEXTS, np.uint8)
+        sources = (directory / _SOURCES).read_text(encoding="utf-8").splitlines()
+        if len(sources) != count or len(offsets) != count + 1 or len(scales) != count:
+            return None
+        return cls(vectors, codes, scales, texts, offsets, sources)
+
+    def text(self, i: int) -> str:
+        return self._texts[self._offsets[i]:self._offsets[i + 1]].tobytes().decode("utf-8")
+
+    def source(self, i: int) -> str:
+        return self._sources[i]
+
+    def rows(self, idx: np.ndarray) -> np.ndarray:
+        """The vectors at *idx*, upcast to float32."""
+        return np.asarray(self.vectors[idx], dtype=np.float32)
+
+    def search(self, query: Sequence[float], k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Indices and cosine scores of the *k* nearest chunks, best first."""
+        k = min(k, len(self))
+        if k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        q = _normalize(np.asarray(query)[None, :])
+        if self._index is not None:
+            scores, idx = self._index.search(q, k)
+            return idx[0], scores[0]
+
+        q_codes, q_scale = _quantize(q[0])
+        approx = np.empty(len(self), dtype=np.float32)
+        for start in range(0, len(self), _BLOCK_ROWS):
+            stop = start + _BLOCK_ROWS
+            approx[start:stop] = _int8_dot(self._codes[start:stop], q_codes)
+        approx *= self._scales * q_scale
+
+        n_cand = min(max(k, _RERANK), len(self))
+        cand = np.argpartition(-approx, n_cand - 1)[:n_cand]
+        scores = self.rows(cand) @ q[0]
+        order = np.argsort(-scores, kind="stable")[:k]
+        return cand[order], scores[order]
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from typing import Iterable, Iterator
 
@@ -59,14 +62,12 @@ def _best_main_container(soup: BeautifulSoup):
     return soup.body or soup
 
 
-def _strip_noise(node) -> None:
-    for tag in node.select(
-        "script,style,noscript,nav,header,footer,form,button,svg,canvas,iframe"
-    ):
-        tag.decompose()
-
-    # Sphinx-specific and other common doc chrome
-    for sel in [
+# Tags and doc chrome (mostly Sphinx) removed before conversion, fused into
+# one selector list so the tree is walked once rather than once per selector.
+_NOISE_SELECTOR = ",".join(
+    [
+        "script", "style", "noscript", "nav", "header", "footer",
+        "form", "button", "svg", "canvas", "iframe",
         ".sphinxsidebar",
         ".sphinxsidebarwrapper",
         ".sidebar",
@@ -82,8 +83,14 @@ def _strip_noise(node) -> None:
         ".admonition-title",  # keep text content but drop the styling container
         ".searchbox",
         "#searchbox",
-    ]:
-        for tag in node.select(sel):
+    ]
+)
+
+
+def _strip_noise(node) -> None:
+    for tag in node.select(_NOISE_SELECTOR):
+        # Matches nested in an already-removed match are gone with it.
+        if not tag.decomposed:
             tag.decompose()
 
 
@@ -109,6 +116,44 @@ def _html_to_markdown(html: str) -> str:
         return soup.get_text("\n", strip=True)
 
 
+def _convert_one(html_path: Path, input_dir: Path, output_dir: Path, force: bool) -> str:
+    """Convert one page; returns ``"converted"``, ``"skipped"`` or ``"failed"``."""
+    rel = html_path.relative_to(input_dir)
+    out_path = (output_dir / rel).with_suffix(".md")
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if (
+        not force
+        and out_path.exists()
+        and out_path.stat().st_mtime >= html_path.stat().st_mtime
+    ):
+        return "skipped"
+
+    try:
+        raw = html_path.read_text(encoding="utf-8", errors="replace")
+        soup = BeautifulSoup(raw, "html.parser")
+        container = _best_main_container(soup)
+        _strip_noise(container)
+
+        title = (soup.title.get_text(" ", strip=True) if soup.title else rel.as_posix())
+        md_body = _html_to_markdown(str(container)).strip()
+
+        # Keep a stable, helpful header for retrieval.
+        header = (
+            f"# {title}\n\n"
+            f"Source: {rel.as_posix()}\n\n"
+        )
+        # Written piecewise so the (possibly large) body is not copied into
+        # a concatenated string first.
+        with out_path.open("w", encoding="utf-8") as fh:
+            fh.write(header)
+            fh.write(md_body)
+            fh.write("\n")
+        return "converted"
+    except Exception:
+        return "failed"
+
+
 def convert_html_dir_to_markdown(
     input_dir: Path,
     output_dir: Path,
@@ -119,43 +164,17 @@ def convert_html_dir_to_markdown(
     output_dir = output_dir.resolve()
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    converted = 0
-    skipped = 0
-    failed = 0
-
-    for html_path in _iter_html_files(input_dir):
-        rel = html_path.relative_to(input_dir)
-        out_path = (output_dir / rel).with_suffix(".md")
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-
-        if (
-            not force
-            and out_path.exists()
-            and out_path.stat().st_mtime >= html_path.stat().st_mtime
-        ):
-            skipped += 1
-            continue
+    convert = partial(_convert_one, input_dir=input_dir, output_dir=output_dir, force=force)
+    # Parsing and markdownify are pure-Python CPU work, so pages are converted
+    # in worker processes; small chunks amortize the pickling round trips.
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        statuses = list(ex.map(convert, _iter_html_files(input_dir), chunksize=8))
 
-        try:
-            raw = html_path.read_text(encoding="utf-8", errors="replace")
-            soup = BeautifulSoup(raw, "html.parser")
-            container = _best_main_container(soup)
-            _strip_noise(container)
-
-            title = (soup.title.get_text(" ", strip=True) if soup.title else rel.as_posix())
-            md_body = _html_to_markdown(str(container)).strip()
-
-            # Keep a stable, helpful header for retrieval.
-            header = (
-                f"# {title}\n\n"
-                f"Source: {rel.as_posix()}\n\n"
-            )
-            out_path.write_text(header + md_body + "\n", encoding="utf-8")
-            converted += 1
-        except Exception:
-            failed += 1
-
-    return ConvertResult(converted=converted, skipped=skipped, failed=failed)
+    return ConvertResult(
+        converted=statuses.count("converted"),
+        skipped=statuses.count("skipped"),
+        failed=statuses.count("failed"),
+    )
 
 
 def _parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
@@ -6,11 +6,28 @@ Supports two back-ends:
     Set it via environment variable *or* Streamlit secrets.
   * **Ollama** (local) – used as fallback when no Groq key is found.
 
-The exported ``llm`` object always exposes ``.invoke(prompt: str) -> str``.
+The exported ``llm`` object always exposes ``.invoke(prompt: str) -> str``
+and its awaitable twin ``.ainvoke(prompt: str) -> str``, which can also hand
+chunks to an ``on_chunk`` callback as they are generated.  Both accept an
+optional keyword-only ``system`` prefix: a static instruction block that is
+sent ahead of the prompt unchanged on every call, so the provider can reuse
+its cached prefix (Groq prompt caching, Ollama KV-cache reuse).
+
+Completions are additionally memoised on disk, keyed on the calling agent's
+tag plus a SHA-256 of the full prompt, so re-running the same dataset skips
+the round-trips entirely.  Set ``LLM_CACHE=0`` to disable; entries expire
+after ``LLM_CACHE_TTL`` seconds (default 24h).
 """
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable
 
 
 # ---------------------------------------------------------------------------
@@ -37,6 +54,120 @@ def _get_ollama_base_url() -> str | None:
     return os.getenv("OLLAMA_BASE_URL") or os.getenv("OLLAMA_HOST") or None
 
 
+# ---------------------------------------------------------------------------
+# Response cache (agent tag + prompt hash -> completion)
+# ---------------------------------------------------------------------------
+
+_CACHE_DIR = Path(os.getenv("LLM_CACHE_DIR", ".llm_cache"))
+
+
+def _cache_ttl() -> float:
+    try:
+        return float(os.getenv("LLM_CACHE_TTL", str(24 * 60 * 60)))
+    except ValueError:
+        return 24 * 60 * 60
+
+
+def _cache_key(agent: str, system: str, prompt: str) -> str:
+    return hashlib.sha256(f"{agent}\0{system}\0{prompt}".encode("utf-8")).hexdigest()
+
+
+def _cache_get(key: str) -> str | None:
+    path = _CACHE_DIR / f"{key}.json"
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if time.time() - entry.get("created", 0) > _cache_ttl():
+        return None
+    return entry.get("text")
+
+
+def _cache_put(key: str, text: str) -> None:
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = _CACHE_DIR / f"{key}.json"
+        path.write_text(json.dumps({"created": time.time(), "text": text}), encoding="utf-8")
+    except OSError:
+        pass
+
+
+class _CachedLLM:
+    """Wrap a backend so repeated ``(agent, prompt)`` pairs are served from disk.
+
+    The backend is built by *factory* on the first cache miss, so importing
+    this module (or answering from the cache) never constructs a client.
+    """
+
+    def __init__(self, factory: Callable[[], object]) -> None:
+        self._factory = factory
+        self._backend = None
+        self._lock = threading.Lock()
+        self._enabled = os.getenv("LLM_CACHE", "1") != "0"
+
+    @property
+    def _inner(self):
+        if self._backend is None:
+            with self._lock:
+                if self._backend is None:
+                    self._backend = self._factory()
+        return self._backend
+
+    def invoke(self, prompt: str, *, system: str = "", agent: str = "") -> str:
+        key = _cache_key(agent, system, prompt)
+        cached = _cache_get(key) if self._enabled else None
+        if cached is not None:
+            return cached
+        text = self._inner.invoke(prompt, system=system)
+        if self._enabled:
+            _cache_put(key, text)
+        return text
+
+    async def ainvoke(
+        self,
+        prompt: str,
+        *,
+        system: str = "",
+        agent: str = "",
+        on_chunk: Callable[[str], None] | None = None,
+    ) -> str:
+        """Return the full completion; with *on_chunk*, stream it there as it arrives."""
+        key = _cache_key(agent, system, prompt)
+        cached = _cache_get(key) if self._enabled else None
+        if cached is not None:
+            if on_chunk is not None:
+                on_chunk(cached)
+            return cached
+        if on_chunk is None:
+            text = await self._inner.ainvoke(prompt, system=system)
+        else:
+            parts: list[str] = []
+            async for chunk in self._inner.astream(prompt, system=system):
+                parts.append(chunk)
+                on_chunk(chunk)
+            text = "".join(parts)
+        if self._enabled:
+            _cache_put(key, text)
+        return text
+
+    async def abatch(
+        self,
+        prompts: list[str],
+        *,
+        system: str = "",
+        agent: str = "",
+        max_concurrency: int = 4,
+    ) -> list[str]:
+        """Run several prompts sharing one *system* prefix, at most *max_concurrency* at a time."""
+        gate = asyncio.Semaphore(max_concurrency)
+
+        async def _one(prompt: str) -> str:
+            async with gate:
+                return await self.ainvoke(prompt, system=system, agent=agent)
+
+        return list(await asyncio.gather(*(_one(p) for p in prompts)))
+
+
 # ---------------------------------------------------------------------------
 # Builder
 # ---------------------------------------------------------------------------
@@ -56,11 +187,23 @@ def _build_llm():
 
         _chat = ChatGroq(api_key=groq_key, model=model, temperature=temperature)
 
+        def _messages(prompt: str, system: str):
+            if not system:
+                return prompt
+            return [("system", system), ("human", prompt)]
+
         # Wrap so .invoke() returns a plain string (same as OllamaLLM).
         class _StrLLM:
             """Thin wrapper that returns ``str`` from ``ChatGroq``."""
-            def invoke(self, prompt: str) -> str:
-                return _chat.invoke(prompt).content
+            def invoke(self, prompt: str, *, system: str = "") -> str:
+                return _chat.invoke(_messages(prompt, system)).content
+
+            async def ainvoke(self, prompt: str, *, system: str = "") -> str:
+                return (await _chat.ainvoke(_messages(prompt, system))).content
+
+            async def astream(self, prompt: str, *, system: str = ""):
+                async for chunk in _chat.astream(_messages(prompt, system)):
+                    yield chunk.content
 
         return _StrLLM()
 
@@ -78,7 +221,23 @@ def _build_llm():
     if base_url:
         kwargs["base_url"] = base_url
 
-    return OllamaLLM(**kwargs)
+    _ollama = OllamaLLM(**kwargs)
+
+    # Completion models take one string; keeping the static prefix first lets
+    # Ollama reuse the KV cache it built for the previous identical prefix.
+    class _PrefixLLM:
+        """Thin wrapper that prepends the ``system`` prefix for ``OllamaLLM``."""
+        def invoke(self, prompt: str, *, system: str = "") -> str:
+            return _ollama.invoke(system + prompt)
+
+        async def ainvoke(self, prompt: str, *, system: str = "") -> str:
+            return await _ollama.ainvoke(system + prompt)
+
+        async def astream(self, prompt: str, *, system: str = ""):
+            async for chunk in _ollama.astream(system + prompt):
+                yield chunk
+
+    return _PrefixLLM()
 
 
-llm = _build_llm()
\ No newline at end of file
+llm = _CachedLLM(_build_llm)
\ No newline at end of file
@@ -13,6 +13,14 @@ _PREAMBLE_PATTERNS = [
     r"^okay[,!]\s+.*$",
 ]
 
+# All preamble patterns fused into one alternation, matched once per line.
+_PREAMBLE_RE = re.compile("|".join(f"(?:{p})" for p in _PREAMBLE_PATTERNS))
+
+_TITLE_RE = re.compile(r"^#{1,3}\s+.+\n+")
+
+# Some models add a colon line like "Rewritten:" then blank.
+_LABEL_LINES = frozenset({"rewritten:", "rewrite:", "output:", "humanized text:"})
+
 
 def strip_model_preamble(text: str) -> str:
     """Remove common LLM meta-prefaces/titles; keep only the rewritten content."""
@@ -22,25 +30,17 @@ def strip_model_preamble(text: str) -> str:
     s = text.strip()
 
     # Remove leading markdown title if the model invents one.
-    s = re.sub(r"^#{1,3}\s+.+\n+", "", s, flags=re.IGNORECASE)
+    s = _TITLE_RE.sub("", s, count=1)
 
-    # Remove one or more preamble lines.
+    # Remove one or more preamble lines; everything after the first content
+    # line is kept as-is.
     lines = s.splitlines()
-    cleaned: list[str] = []
-    skipping = True
-    for line in lines:
-        raw = line.strip()
-        if skipping:
-            if raw == "":
-                continue
-            lowered = raw.lower()
-            if any(re.match(p, lowered) for p in _PREAMBLE_PATTERNS):
-                continue
-            # Some models add a colon line like "Rewritten:" then blank.
-            if lowered in {"rewritten:", "rewrite:", "output:", "humanized text:"}:
-                continue
-            skipping = False
-
-        cleaned.append(line)
-
-    return "\n".join(cleaned).strip()
+    start = len(lines)
+    for i, line in enumerate(lines):
+        lowered = line.strip().lower()
+        if lowered == "" or lowered in _LABEL_LINES or _PREAMBLE_RE.match(lowered):
+            continue
+        start = i
+        break
+
+    return "\n".join(lines[start:]).strip()
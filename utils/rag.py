@@ -1,7 +1,16 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
 
 # Prefer new packages; fall back for compatibility.
 try:
@@ -14,16 +23,39 @@ try:
 except Exception:  # pragma: no cover
     from langchain_community.vectorstores import Chroma
 
-from langchain_community.document_loaders import TextLoader
+from langchain_core.documents import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
+from utils.embed_cache import embed_documents_cached
+from utils.faiss_store import FlatIPStore
+
 _PDF_DIR = Path("memory/pdfs")
 _MD_DIR = Path("memory/md")
 _CHROMA_DIR = Path("memory/chroma")
+_EMBED_CACHE = _CHROMA_DIR / "embed_cache.sqlite"
+# Indexed Markdown files: path -> [mtime_ns, blake2b of contents].
+_MANIFEST = _CHROMA_DIR / "manifest.json"
+_FLAT_DIR = Path("memory/flat")
+_FLAT_MANIFEST = _FLAT_DIR / "manifest.json"
 _COLLECTION = "cleaning_strategies"
 _EMBED_MODEL = "nomic-embed-text"
+_INDEX_BATCH = 128
+_CHUNK_SIZE = 1200
+_CHUNK_OVERLAP = 200
+_MD_WRITE_BUFFER = 1 << 20
+_LOAD_WORKERS = 16
+# Pages with less extracted text than this (blank or scan-only) are skipped.
+_MIN_PAGE_CHARS = 20
+
+_vectorstore: Optional[Union[Chroma, FlatIPStore]] = None
+_vectorstore_lock = threading.Lock()
 
-_vectorstore: Optional[Chroma] = None
+# Retrieval results are reused for the same query, or for one whose embedding
+# is nearly identical (re-runs, or datasets with near-identical profiles).
+_CACHE_SIZE = 256
+_CACHE_MIN_SIMILARITY = 0.95
+_cache: "OrderedDict[Tuple[str, int], Tuple[np.ndarray, str]]" = OrderedDict()
+_cache_lock = threading.Lock()
 
 
 def _get_ollama_base_url() -> str | None:
@@ -39,12 +71,106 @@ def _get_embed_model() -> str:
     return os.getenv("OLLAMA_EMBED_MODEL", _EMBED_MODEL)
 
 
+def _get_backend() -> str:
+    import os
+
+    return os.getenv("RAG_BACKEND", "chroma").strip().lower()
+
+
+def _get_index_batch() -> int:
+    import os
+
+    try:
+        return max(1, int(os.getenv("RAG_INDEX_BATCH", str(_INDEX_BATCH))))
+    except ValueError:
+        return _INDEX_BATCH
+
+
+def _split_documents(docs: List[Document]) -> List[Document]:
+    """
+    Split Markdown documents into overlapping chunks.
+    Uses the Rust ``semantic-text-splitter`` (Markdown-aware) when installed,
+    otherwise LangChain's recursive character splitter.
+    """
+    try:
+        from semantic_text_splitter import MarkdownSplitter
+    except ImportError:
+        splitter = RecursiveCharacterTextSplitter(
+            chunk_size=_CHUNK_SIZE, chunk_overlap=_CHUNK_OVERLAP
+        )
+        return splitter.split_documents(docs)
+
+    splitter = MarkdownSplitter(_CHUNK_SIZE, overlap=_CHUNK_OVERLAP)
+    return [
+        Document(page_content=chunk, metadata=dict(d.metadata))
+        for d in docs
+        for chunk in splitter.chunks(d.page_content)
+    ]
+
+
+def _chunk_id(doc) -> str:
+    """Stable id from a chunk's source and text, so re-indexing is idempotent."""
+    key = f"{doc.metadata.get('source', '')}\0{doc.page_content}"
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+
 def _truncate(text: str, max_chars: int) -> str:
     if max_chars <= 0:
         return ""
     if len(text) <= max_chars:
         return text
-    return text[:max_chars].rsplit("\n", 1)[0].strip() + "\n"
+    # Cut at the last line break inside the limit without copying the prefix first.
+    cut = text.rfind("\n", 0, max_chars)
+    return text[:cut if cut != -1 else max_chars].strip() + "\n"
+
+
+def _page_text(page, fitz) -> str:
+    """Text blocks of *page* in reading order, one paragraph per block."""
+    blocks = page.get_text(
+        "blocks", flags=fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_DEHYPHENATE
+    )
+    text_blocks = sorted((b for b in blocks if b[6] == 0), key=lambda b: (b[1], b[0]))
+    # Blank lines between blocks give the splitter clean paragraph boundaries.
+    return "\n\n".join(t for t in (b[4].strip() for b in text_blocks) if t)
+
+
+@contextmanager
+def _open_md_atomic(out_path):
+    """Stream writes to ``<out_path>.tmp`` and move it into place once complete.
+
+    A run that fails or is interrupted mid-PDF then leaves no partial Markdown
+    behind for the ``exists()`` check to skip on the next run.
+    """
+    tmp = Path(f"{out_path}.tmp")
+    try:
+        with tmp.open("w", encoding="utf-8", buffering=_MD_WRITE_BUFFER) as out:
+            yield out
+        tmp.replace(out_path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _extract_pdf_pymupdf(pdf_path: str, out_path: str) -> str:
+    """Write one PDF as Markdown with PyMuPDF (module-level so it pickles)."""
+    import fitz  # pymupdf
+
+    doc = fitz.open(pdf_path)
+    try:
+        # Pages are written as they are extracted, never joined in memory.
+        with _open_md_atomic(out_path) as out:
+            out.write(f"# {Path(pdf_path).stem}\n")
+            for i in range(doc.page_count):
+                # One page object alive at a time; it is dropped on rebinding.
+                text = _page_text(doc.load_page(i), fitz)
+                if len(text) >= _MIN_PAGE_CHARS:
+                    out.write(f"\n## Page {i + 1}\n\n{text}\n")
+    finally:
+        doc.close()
+        # Empty MuPDF's shared object store so a worker's memory does not grow
+        # with every document it converts.
+        fitz.TOOLS.store_shrink(100)
+    return out_path
 
 
 def convert_pdfs_to_markdown(pdf_dir: Path = _PDF_DIR, md_dir: Path = _MD_DIR) -> List[Path]:
@@ -60,22 +186,21 @@ def convert_pdfs_to_markdown(pdf_dir: Path = _PDF_DIR, md_dir: Path = _MD_DIR) -
 
     # Prefer PyMuPDF for more reliable extraction; fall back to pypdf.
     try:
-        import fitz  # pymupdf
-        for pdf in pdfs:
-            out_md = md_dir / f"{pdf.stem}.md"
-            if out_md.exists():
-                out_paths.append(out_md)
-                continue
-
-            doc = fitz.open(pdf)
-            parts = [f"# {pdf.stem}\n"]
-            for i, page in enumerate(doc, start=1):
-                text = page.get_text("text").strip()
-                if not text:
-                    continue
-                parts.append(f"## Page {i}\n\n{text}\n")
-            out_md.write_text("\n".join(parts), encoding="utf-8")
-            out_paths.append(out_md)
+        import fitz  # noqa: F401  (pymupdf)
+
+        todo = [pdf for pdf in pdfs if not (md_dir / f"{pdf.stem}.md").exists()]
+        if todo:
+            import os
+
+            # Page layout decoding is CPU-bound, so PDFs are extracted in
+            # parallel worker processes.
+            with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, 4)) as ex:
+                list(ex.map(
+                    _extract_pdf_pymupdf,
+                    [str(pdf) for pdf in todo],
+                    [str(md_dir / f"{pdf.stem}.md") for pdf in todo],
+                ))
+        out_paths = [md_dir / f"{pdf.stem}.md" for pdf in pdfs]
 
     except Exception:
         from pypdf import PdfReader
@@ -86,22 +211,95 @@ def convert_pdfs_to_markdown(pdf_dir: Path = _PDF_DIR, md_dir: Path = _MD_DIR) -
                 continue
 
             reader = PdfReader(str(pdf))
-            parts = [f"# {pdf.stem}\n"]
-            for i, page in enumerate(reader.pages, start=1):
-                text = (page.extract_text() or "").strip()
-                if not text:
-                    continue
-                parts.append(f"## Page {i}\n\n{text}\n")
-            out_md.write_text("\n".join(parts), encoding="utf-8")
+            with _open_md_atomic(out_md) as out:
+                out.write(f"# {pdf.stem}\n")
+                for i, page in enumerate(reader.pages, start=1):
+                    text = (page.extract_text() or "").strip()
+                    if text:
+                        out.write(f"\n## Page {i}\n\n{text}\n")
             out_paths.append(out_md)
 
     return out_paths
 
 
+@lru_cache(maxsize=1)
+def _make_embeddings(model: str, base_url: str | None) -> OllamaEmbeddings:
+    """One embeddings client per (model, server), reused across index builds."""
+    embed_kwargs: dict = {"model": model}
+    if base_url:
+        embed_kwargs["base_url"] = base_url
+    return OllamaEmbeddings(**embed_kwargs)
+
+
+@lru_cache(maxsize=256)
+def _embed_query_cached(model: str, base_url: str | None, query: str) -> Tuple[float, ...]:
+    """Query embedding, reused for repeated queries (keyed on the model too)."""
+    return tuple(_make_embeddings(model, base_url).embed_query(query))
+
+
+def _load_markdown(md: Path) -> Document:
+    # The Markdown is written by this module as UTF-8; no loader or detection needed.
+    return Document(page_content=md.read_bytes().decode("utf-8"), metadata={"source": str(md)})
+
+
+def _load_chunks(md_files: List[Path]) -> List[Document]:
+    # File reads block with the GIL released, so they overlap on threads.
+    with ThreadPoolExecutor(max_workers=_LOAD_WORKERS) as ex:
+        docs = list(ex.map(_load_markdown, md_files))
+    return _split_documents(docs)
+
+
+def _file_digest(path: Path) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _read_manifest(path: Path) -> Dict[str, list]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_manifest(path: Path, manifest: Dict[str, list]) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, sort_keys=True), encoding="utf-8")
+    tmp.replace(path)
+
+
+def _scan_md_files(md_files: List[Path], indexed: Dict[str, list]) -> Tuple[Dict[str, list], List[Path]]:
+    """Current manifest for *md_files*, and the files whose contents differ from *indexed*.
+
+    Files are only hashed when their mtime moved, so an unchanged corpus
+    costs one ``stat`` per file.
+    """
+    manifest: Dict[str, list] = {}
+    changed: List[Path] = []
+    for md in md_files:
+        key = str(md)
+        mtime_ns = md.stat().st_mtime_ns
+        entry = indexed.get(key)
+        if entry and entry[0] == mtime_ns:
+            manifest[key] = entry
+            continue
+        digest = _file_digest(md)
+        manifest[key] = [mtime_ns, digest]
+        if not entry or entry[1] != digest:
+            changed.append(md)
+    return manifest, changed
+
+
 def build_or_load_vectorstore(force_reindex: bool = False) -> Optional[Chroma]:
     """
     Builds/loads a persistent Chroma index from Markdown in memory/md.
     Returns None if there is nothing to index.
+
+    The index is kept in sync file by file: chunks of edited or deleted
+    Markdown are dropped, and only edited or new files are split and
+    embedded again. ``force_reindex`` treats every file as edited.
     """
     _CHROMA_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -112,48 +310,237 @@ def build_or_load_vectorstore(force_reindex: bool = False) -> Optional[Chroma]:
     if not md_files:
         return None
 
-    embed_kwargs: dict = {"model": _get_embed_model()}
-    base_url = _get_ollama_base_url()
-    if base_url:
-        embed_kwargs["base_url"] = base_url
+    embed_model = _get_embed_model()
+    embeddings = _make_embeddings(embed_model, _get_ollama_base_url())
 
-    embeddings = OllamaEmbeddings(**embed_kwargs)
+    indexed: Dict[str, list] = {}
+    if (_CHROMA_DIR / "chroma.sqlite3").exists() and not force_reindex:
+        indexed = _read_manifest(_MANIFEST)
+    manifest, changed = _scan_md_files(md_files, indexed)
 
-    chroma_sqlite = _CHROMA_DIR / "chroma.sqlite3"
-    if chroma_sqlite.exists() and not force_reindex:
-        return Chroma(
-            persist_directory=str(_CHROMA_DIR),
-            embedding_function=embeddings,
-            collection_name=_COLLECTION,
-        )
-
-    docs = []
-    for md in md_files:
-        loader = TextLoader(str(md), encoding="utf-8")
-        loaded = loader.load()
-        for d in loaded:
-            d.metadata["source"] = str(md)
-        docs.extend(loaded)
-
-    splitter = RecursiveCharacterTextSplitter(chunk_size=1200, chunk_overlap=200)
-    chunks = splitter.split_documents(docs)
-
-    vs = Chroma.from_documents(
-        documents=chunks,
-        embedding=embeddings,
+    vs = Chroma(
         persist_directory=str(_CHROMA_DIR),
+        embedding_function=embeddings,
         collection_name=_COLLECTION,
     )
+    if not changed and manifest.keys() == indexed.keys():
+        if manifest != indexed:
+            # Touched but identical files: record the new mtimes only.
+            _write_manifest(_MANIFEST, manifest)
+        return vs
+
+    collection = vs._collection
+    stale = sorted((indexed.keys() - manifest.keys()) | {str(md) for md in changed})
+    if stale:
+        collection.delete(where={"source": {"$in": stale}})
+
+    # Repeated chunks within a file share an id; keep one of each.
+    by_id = {_chunk_id(d): d for d in _load_chunks(changed)}
+    ids = list(by_id)
+    # Upsert in bounded batches: each one is a single embed + write
+    # transaction, and the whole corpus is never held as one request.
+    # Stable ids make a repeated or interrupted sync converge instead of
+    # duplicating chunks.
+    batch = _get_index_batch()
+    for start in range(0, len(ids), batch):
+        part = ids[start:start + batch]
+        docs = [by_id[i] for i in part]
+        texts = [d.page_content for d in docs]
+        collection.upsert(
+            ids=part,
+            documents=texts,
+            metadatas=[d.metadata for d in docs],
+            # Vectors of unchanged chunks come from the embedding cache.
+            embeddings=embed_documents_cached(
+                embeddings, texts, model=embed_model, path=_EMBED_CACHE
+            ),
+        )
+    # Written last: an interrupted sync is redone on the next load.
+    _write_manifest(_MANIFEST, manifest)
+    # Results cached before the sync may quote removed or outdated chunks.
+    _clear_result_cache()
     return vs
 
 
-def _get_vectorstore() -> Optional[Chroma]:
+def build_or_load_flat_store(force_reindex: bool = False) -> Optional[FlatIPStore]:
+    """
+    Builds/loads the flat inner-product store (``RAG_BACKEND=faiss``) from
+    Markdown in memory/md. Returns None if there is nothing to index.
+
+    The saved store is reused only while the corpus matches its manifest (as
+    for Chroma); otherwise it is rebuilt, with unchanged chunks' vectors
+    served from the embedding cache.
+    """
+    convert_pdfs_to_markdown()
+
+    md_files = sorted([p for p in _MD_DIR.rglob("*.md") if p.is_file()])
+    if not md_files:
+        return None
+
+    embed_model = _get_embed_model()
+    indexed = {} if force_reindex else _read_manifest(_FLAT_MANIFEST)
+    manifest, changed = _scan_md_files(md_files, indexed)
+    if not changed and manifest.keys() == indexed.keys():
+        store = FlatIPStore.load(_FLAT_DIR, model=embed_model)
+        if store is not None:
+            if manifest != indexed:
+                _write_manifest(_FLAT_MANIFEST, manifest)
+            return store
+
+    by_id = {_chunk_id(d): d for d in _load_chunks(md_files)}
+    chunks = list(by_id.values())
+    texts = [d.page_content for d in chunks]
+    embeddings = _make_embeddings(embed_model, _get_ollama_base_url())
+    batch = _get_index_batch()
+    vectors: List[List[float]] = []
+    for start in range(0, len(texts), batch):
+        vectors.extend(embed_documents_cached(
+            embeddings, texts[start:start + batch], model=embed_model, path=_EMBED_CACHE
+        ))
+    store = FlatIPStore.build(
+        _FLAT_DIR,
+        texts,
+        [d.metadata.get("source", "") for d in chunks],
+        np.asarray(vectors, dtype=np.float32),
+        model=embed_model,
+    )
+    _write_manifest(_FLAT_MANIFEST, manifest)
+    _clear_result_cache()
+    return store
+
+
+def _get_vectorstore() -> Optional[Union[Chroma, FlatIPStore]]:
     global _vectorstore
     if _vectorstore is None:
-        _vectorstore = build_or_load_vectorstore()
+        # Streamlit sessions run on separate threads; build the store once.
+        with _vectorstore_lock:
+            if _vectorstore is None:
+                if _get_backend() == "faiss":
+                    _vectorstore = build_or_load_flat_store()
+                else:
+                    _vectorstore = build_or_load_vectorstore()
     return _vectorstore
 
 
+def reset_vectorstore_cache() -> None:
+    """Drop the cached store, embeddings client and retrieval results."""
+    global _vectorstore
+    with _vectorstore_lock:
+        _vectorstore = None
+    _make_embeddings.cache_clear()
+    _embed_query_cached.cache_clear()
+    _clear_result_cache()
+
+
+def _unit(vector) -> np.ndarray:
+    v = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(v))
+    return v / norm if norm else v
+
+
+def _mmr_select(query: np.ndarray, candidates: np.ndarray, k: int, lambda_mult: float = 0.5) -> List[int]:
+    """Maximal marginal relevance over *candidates*, returning picked row indices.
+
+    The candidate-candidate cosine matrix is one matrix product, and each
+    step updates every candidate's redundancy with a single ``np.maximum``.
+    """
+    vecs = candidates.astype(np.float32, copy=False)
+    norms = np.linalg.norm(vecs, axis=1, keepdims=True)
+    vecs = vecs / np.where(norms == 0, 1, norms)
+    relevance = vecs @ _unit(query)
+    similarity = vecs @ vecs.T
+
+    first = int(np.argmax(relevance))
+    picked = [first]
+    redundancy = similarity[:, first].copy()
+    available = np.ones(len(vecs), dtype=bool)
+    available[first] = False
+    while len(picked) < min(k, len(vecs)):
+        score = lambda_mult * relevance - (1 - lambda_mult) * redundancy
+        score[~available] = -np.inf
+        best = int(np.argmax(score))
+        picked.append(best)
+        available[best] = False
+        np.maximum(redundancy, similarity[:, best], out=redundancy)
+    return picked
+
+
+def _flat_documents(vs: FlatIPStore, idx) -> List[Document]:
+    # Documents are materialized only for the returned chunks.
+    return [Document(page_content=vs.text(i), metadata={"source": vs.source(i)}) for i in idx]
+
+
+def _similarity_search(vs: Union[Chroma, FlatIPStore], embedding: List[float], k: int) -> List[Document]:
+    """Plain top-*k* search, the fallback when MMR fails."""
+    if isinstance(vs, FlatIPStore):
+        idx, _ = vs.search(embedding, k)
+        return _flat_documents(vs, idx)
+    return vs.similarity_search_by_vector(embedding, k=k)
+
+
+def _mmr_search(vs: Union[Chroma, FlatIPStore], embedding: List[float], k: int, fetch_k: int) -> List[Document]:
+    """Fetch *fetch_k* neighbours with their vectors and keep *k* by MMR."""
+    if isinstance(vs, FlatIPStore):
+        idx, _ = vs.search(embedding, fetch_k)
+        if not len(idx):
+            return []
+        return _flat_documents(vs, idx[_mmr_select(np.asarray(embedding), vs.rows(idx), k)])
+    res = vs._collection.query(
+        query_embeddings=[embedding],
+        n_results=fetch_k,
+        include=["documents", "metadatas", "embeddings"],
+    )
+    texts = res["documents"][0]
+    if not texts:
+        return []
+    metadatas = res["metadatas"][0]
+    picks = _mmr_select(np.asarray(embedding), np.asarray(res["embeddings"][0]), k)
+    return [Document(page_content=texts[i], metadata=metadatas[i] or {}) for i in picks]
+
+
+def _cache_exact(key: Tuple[str, int]) -> Optional[str]:
+    with _cache_lock:
+        hit = _cache.get(key)
+        if hit is None:
+            return None
+        _cache.move_to_end(key)
+        return hit[1]
+
+
+def _cache_nearest(unit: np.ndarray, k: int) -> Optional[str]:
+    """Cached result whose query embedding has cosine >= the threshold, if any."""
+    with _cache_lock:
+        keys = [key for key in _cache if key[1] == k]
+        if not keys:
+            return None
+        matrix = np.stack([_cache[key][0] for key in keys])
+        if matrix.shape[1] != unit.shape[0]:
+            return None
+        sims = matrix @ unit
+        best = int(np.argmax(sims))
+        if sims[best] < _CACHE_MIN_SIMILARITY:
+            return None
+        _cache.move_to_end(keys[best])
+        return _cache[keys[best]][1]
+
+
+def _clear_result_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
+
+
+def _cache_put(key: Tuple[str, int], unit: np.ndarray, text: str) -> None:
+    if not text:
+        # An empty result (e.g. queried before indexing finished) would
+        # otherwise be served for every similar query.
+        return
+    with _cache_lock:
+        _cache[key] = (unit, text)
+        _cache.move_to_end(key)
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+
+
 def retrieve_strategy_context(dataset_query: str, k: int = 5, max_chars: int = 3000) -> str:
     """
     Retrieves relevant data cleaning strategies from the knowledge base.
@@ -161,7 +548,14 @@ def retrieve_strategy_context(dataset_query: str, k: int = 5, max_chars: int = 3
 
     Returns an empty string when the vector store is unavailable (e.g. no
     Ollama on Streamlit Cloud) so the pipeline still completes successfully.
+    Results are cached by exact query, then by query-embedding similarity;
+    failures are not cached, so a provider that comes back is used again.
     """
+    key = (dataset_query, k)
+    cached = _cache_exact(key)
+    if cached is not None:
+        return _truncate(cached, max_chars=max_chars)
+
     try:
         vs = _get_vectorstore()
     except Exception:
@@ -178,11 +572,20 @@ def retrieve_strategy_context(dataset_query: str, k: int = 5, max_chars: int = 3
     )
 
     try:
+        # Embed once: the vector both probes the cache and drives the search.
+        embedding = list(
+            _embed_query_cached(_get_embed_model(), _get_ollama_base_url(), query)
+        )
+        unit = _unit(embedding)
+        cached = _cache_nearest(unit, k)
+        if cached is not None:
+            _cache_put(key, unit, cached)
+            return _truncate(cached, max_chars=max_chars)
         # Prefer diverse snippets if available.
         try:
-            results = vs.max_marginal_relevance_search(query, k=k, fetch_k=max(12, k * 3))
+            results = _mmr_search(vs, embedding, k=k, fetch_k=max(12, k * 3))
         except Exception:
-            results = vs.similarity_search(query, k=k)
+            results = _similarity_search(vs, embedding, k)
     except Exception:
         # Connection to embedding provider failed during query
         return ""
@@ -194,4 +597,6 @@ def retrieve_strategy_context(dataset_query: str, k: int = 5, max_chars: int = 3
         if snippet:
             lines.append(f"[{src}] {snippet}")
 
-    return _truncate("\n\n".join(lines), max_chars=max_chars)
\ No newline at end of file
+    text = "\n\n".join(lines)
+    _cache_put(key, unit, text)
+    return _truncate(text, max_chars=max_chars)
\ No newline at end of file